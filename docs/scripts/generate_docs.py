@@ -1,9 +1,15 @@
 import os
-import shutil
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # libyaml bindings unavailable
+    from yaml import SafeDumper, SafeLoader  # type: ignore[assignment]
+
 # Directories to include in documentation
 SOURCE_DIRS = ["src/picsellia_cv_engine"]
 
@@ -19,6 +25,12 @@ EXCLUDE_FILES = [
     "src/picsellia_cv_engine/core/data/coco_file_manager.py",
 ]
 
+# Tuples so exclusion checks are a single str.startswith / str.endswith call.
+# Bare file names can be matched against the file name alone, without joining paths.
+_EXCLUDE_DIRS = tuple(EXCLUDE_DIRS)
+_EXCLUDE_FILE_NAMES = tuple(f for f in EXCLUDE_FILES if "/" not in f)
+_EXCLUDE_FILE_PATHS = tuple(f for f in EXCLUDE_FILES if "/" in f)
+
 DOCS_DIR = "docs/api"
 MKDOCS_CONFIG_FILE = "mkdocs.yml"
 
@@ -36,71 +48,114 @@ MKDOCS_TEMPLATE = """# {title}
 
 def should_exclude(path, filename=None):
     """Check if a path or specific file should be excluded."""
-    if any(path.startswith(exclude) for exclude in EXCLUDE_DIRS):
+    if path.startswith(_EXCLUDE_DIRS):
         return True
 
     if filename:
+        if filename.endswith(_EXCLUDE_FILE_NAMES):
+            return True
+        if not _EXCLUDE_FILE_PATHS:
+            return False
         full_file_path = os.path.join(path, filename).replace("\\", "/")
-        return any(
-            full_file_path.endswith(exclude_file) or full_file_path == exclude_file
-            for exclude_file in EXCLUDE_FILES
-        )
+        return full_file_path.endswith(_EXCLUDE_FILE_PATHS)
 
     return False
 
 
+def write_if_changed(path, content):
+    """Write bytes to path unless the file already holds them. Return True if written."""
+    try:
+        with open(path, "rb") as existing:
+            if existing.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+
+    # Outputs are small: write the encoded content in a single unbuffered call
+    with open(path, "wb", buffering=0) as f:
+        f.write(content)
+    return True
+
+
+def walk_python_files(root):
+    """Yield ``(directory, python_files)`` pairs below root, pruning excluded directories."""
+    if should_exclude(root):
+        return
+
+    files = []
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False) and entry.name.endswith(".py"):
+                files.append(entry.name)
+
+    yield root, files
+    for subdir in subdirs:
+        yield from walk_python_files(subdir)
+
+
 def generate_markdown():
     os.makedirs(DOCS_DIR, exist_ok=True)
+    created_dirs = {DOCS_DIR}
     generated_files = []
+    pages = []
 
     for source_dir in SOURCE_DIRS:
-        for root, _, files in os.walk(source_dir):
-            if should_exclude(root):
-                continue
+        for root, files in walk_python_files(source_dir):
+            # Everything derived from the directory is computed once per directory
+            package = os.path.relpath(root, "src").replace(os.sep, ".")
+            relative_path = (
+                root.replace(source_dir, "").strip(os.sep).replace(os.sep, "/")
+            )
+            output_dir = os.path.join(DOCS_DIR, relative_path)
 
             for file in files:
-                if file.endswith(".py") and file != "__init__.py":
-                    if should_exclude(root, file):
-                        continue
-
-                    module_path = (
-                        os.path.join(root, file)
-                        .replace("/", ".")
-                        .replace("\\", ".")
-                        .replace(".py", "")
-                    )
-                    module_path = module_path.replace("src.", "")
-                    module_name = module_path.replace("picsellia_cv_engine.", "")
-
-                    title = module_name  # Keep full dotted path as lowercase title
-
-                    relative_path = (
-                        root.replace(source_dir, "").strip(os.sep).replace(os.sep, "/")
-                    )
-                    output_dir = os.path.join(DOCS_DIR, relative_path)
+                if file == "__init__.py" or should_exclude(root, file):
+                    continue
+
+                stem = file[:-3]
+                module_path = f"{package}.{stem}"
+                # Keep full dotted path as lowercase title
+                title = module_path.removeprefix("picsellia_cv_engine.")
+
+                if output_dir not in created_dirs:
                     os.makedirs(output_dir, exist_ok=True)
+                    created_dirs.add(output_dir)
+
+                md_file = f"{stem}.md"
+                md_filename = os.path.join(output_dir, md_file)
+                md_content = MKDOCS_TEMPLATE.format(title=title, module=module_path)
 
-                    md_filename = os.path.join(
-                        output_dir, f"{file.replace('.py', '.md')}"
-                    )
-                    md_content = MKDOCS_TEMPLATE.format(title=title, module=module_path)
+                generated_files.append((relative_path, md_file))
+                pages.append((md_filename, md_content.encode("utf-8")))
 
-                    with open(md_filename, "w") as md_file:
-                        md_file.write(md_content)
+    # Directories already exist at this point, so the writes are independent and
+    # their I/O can overlap across threads.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        written = list(executor.map(lambda page: write_if_changed(*page), pages))
 
-                    generated_files.append((relative_path, file.replace(".py", ".md")))
-                    print(f"✅ Generated: {md_filename}")
+    for (md_filename, _), was_written in zip(pages, written, strict=True):
+        if was_written:
+            print(f"✅ Generated: {md_filename}")
 
     return generated_files
 
 
+@cache
+def display_name_from_filename(file):
+    """Nav label for a generated page, e.g. ``model_loader.md`` -> ``model loader``."""
+    return file.replace(".md", "").replace("_", " ")
+
+
 def update_mkdocs_nav(generated_files):
     if not os.path.exists(MKDOCS_CONFIG_FILE):
         print(f"❌ Error: {MKDOCS_CONFIG_FILE} not found!")
         return
 
     with open(MKDOCS_CONFIG_FILE) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
 
     # Remove previous API entries
     config["nav"] = [
@@ -110,48 +165,79 @@ def update_mkdocs_nav(generated_files):
     ]
 
     api_section: dict[str, list] = {"API Reference": [{"Overview": "api/index.md"}]}
-    structure: dict[str, Any] = {}
-
-    for path, file in generated_files:
-        sections = path.split("/") if path else []
-        target = structure
-
-        for section in sections:
-            target = target.setdefault(section, {})  # Keep lowercase
 
-        display_name = file.replace(".md", "").replace("_", " ")
-        target[display_name] = f"api/{path}/{file}" if path else f"api/{file}"
-
-    def build_nav(struct: dict) -> list:
-        nav = []
-        for key, value in sorted(struct.items()):
-            if isinstance(value, dict):
-                nav.append({key: build_nav(value)})
-            else:
-                nav.append({key: value})
-        return nav
+    # Sorting the full (sections..., page) keys once orders every nav level at the
+    # same time, and keeps each section's pages contiguous.
+    pages = sorted(
+        (
+            (*(path.split("/") if path else ()), display_name_from_filename(file)),
+            f"api/{path}/{file}" if path else f"api/{file}",
+        )
+        for path, file in generated_files
+    )
+
+    # Child lists of the sections opened so far, keyed on their path
+    section_children: dict[tuple[str, ...], list] = {(): api_section["API Reference"]}
+    for key, link in pages:
+        parent = section_children[()]
+        for depth in range(1, len(key)):
+            children = section_children.get(key[:depth])
+            if children is None:
+                children = section_children[key[:depth]] = []
+                parent.append({key[depth - 1]: children})  # Keep lowercase
+            parent = children
+        parent.append({key[-1]: link})
 
-    api_section["API Reference"].extend(build_nav(structure))
     config["nav"].append(api_section)
 
-    with open(MKDOCS_CONFIG_FILE, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    new_config = yaml.dump(
+        config,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    if write_if_changed(MKDOCS_CONFIG_FILE, new_config.encode("utf-8")):
+        print(f"✅ Updated {MKDOCS_CONFIG_FILE} with new API navigation.")
+    else:
+        print(f"✅ {MKDOCS_CONFIG_FILE} API navigation already up to date.")
+
+
+def remove_stale_entries(directory, expected):
+    """Delete files not in expected below directory, then the directory if left empty."""
+    is_empty = True
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                is_empty &= remove_stale_entries(entry.path, expected)
+            elif os.path.normpath(entry.path) in expected:
+                is_empty = False
+            else:
+                os.unlink(entry.path)
 
-    print(f"✅ Updated {MKDOCS_CONFIG_FILE} with new API navigation.")
+    if is_empty:
+        os.rmdir(directory)
+    return is_empty
 
 
-def clean_docs_dir():
-    """Remove all files and folders in DOCS_DIR except index.md."""
+def clean_docs_dir(generated_files):
+    """Remove files and folders in DOCS_DIR subdirectories that were not just generated."""
     if not os.path.exists(DOCS_DIR):
         return
 
-    for item in os.listdir(DOCS_DIR):
-        item_path = os.path.join(DOCS_DIR, item)
-        if os.path.isdir(item_path):
-            shutil.rmtree(item_path)
+    expected = {
+        os.path.normpath(os.path.join(DOCS_DIR, path, file))
+        for path, file in generated_files
+    }
+    with os.scandir(DOCS_DIR) as entries:
+        subdirs = [
+            entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+        ]
+
+    for subdir in subdirs:
+        remove_stale_entries(subdir, expected)
 
 
 if __name__ == "__main__":
-    clean_docs_dir()
     generated_files = generate_markdown()
+    clean_docs_dir(generated_files)
     update_mkdocs_nav(generated_files)
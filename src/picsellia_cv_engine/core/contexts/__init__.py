@@ -2,6 +2,7 @@ from .common import PicselliaContext
 from .processing import (
     LocalDatalakeProcessingContext,
     LocalDatasetProcessingContext,
+    LocalModelProcessingContext,
     PicselliaDatalakeProcessingContext,
     PicselliaDatasetProcessingContext,
     PicselliaModelProcessingContext,
@@ -12,10 +13,10 @@ __all__ = [
     "PicselliaContext",
     "LocalDatalakeProcessingContext",
     "LocalDatasetProcessingContext",
+    "LocalModelProcessingContext",
     "PicselliaDatalakeProcessingContext",
     "PicselliaDatasetProcessingContext",
     "PicselliaModelProcessingContext",
-    "PicselliaDatasetProcessingContext",
     "LocalTrainingContext",
     "PicselliaTrainingContext",
 ]
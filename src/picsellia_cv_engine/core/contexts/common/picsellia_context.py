@@ -1,11 +1,13 @@
 import os
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any
 
 import picsellia
 import requests
 
 from picsellia_cv_engine.core.logging.colors import Colors
+from picsellia_cv_engine.core.parameters import Parameters
 
 
 class PicselliaContext(ABC):
@@ -16,6 +18,7 @@ class PicselliaContext(ABC):
         organization_id: str | None = None,
         organization_name: str | None = None,
         working_dir: str | None = None,
+        client: picsellia.Client | None = None,
     ):
         """
         Base class for defining a context within the Picsellia platform.
@@ -31,6 +34,8 @@ class PicselliaContext(ABC):
             organization_id (Optional[str]): ID of the Picsellia organization. Can also be set via the 'organization_id' env variable.
             organization_name (Optional[str]): Name of the Picsellia organization. Can also be set via the 'organization_name' env variable.
             working_dir (Optional[str]): Optional override for the working directory.
+            client (Optional[picsellia.Client]): An existing client to reuse, for instance the client
+                of another context. By default, the context creates its own client on first access.
         """
         self.api_token = api_token or os.getenv("api_token")
 
@@ -40,15 +45,18 @@ class PicselliaContext(ABC):
             )
 
         self.host = host or os.getenv("host", "https://app.picsellia.com")
-        self.organization_id = organization_id or os.getenv("organization_id")
+        # Resolved from the client on first access when not configured, see organization_id
+        self._organization_id = organization_id or os.getenv("organization_id")
         self.organization_name = organization_name or os.getenv("organization_name")
 
-        self.client = self._initialize_client()
+        self._working_dir_override = working_dir
 
-        if not self.organization_id:
-            self.organization_id = self.client.connexion.organization_id
+        if client is not None:
+            self.client = client
 
-        self._working_dir_override = working_dir
+        # Versions fetched by ID, memoized for the lifetime of this context
+        self._model_versions: dict[str, picsellia.ModelVersion] = {}
+        self._dataset_versions: dict[str, picsellia.DatasetVersion] = {}
 
     @property
     @abstractmethod
@@ -67,6 +75,31 @@ class PicselliaContext(ABC):
         """
         raise NotImplementedError("Subclasses must define a working_dir.")
 
+    @property
+    def organization_id(self) -> str:
+        """
+        ID of the Picsellia organization.
+
+        When neither given nor set in the environment, it is read from the client's
+        connection on first access, so creating a context does not create the client.
+
+        Returns:
+            str: The organization ID.
+        """
+        if not self._organization_id:
+            self._organization_id = self.client.connexion.organization_id
+        return self._organization_id
+
+    @cached_property
+    def client(self) -> picsellia.Client:
+        """
+        Picsellia client, created on first access unless one was given to the context.
+
+        Returns:
+            picsellia.Client: An authenticated client object.
+        """
+        return self._initialize_client()
+
     def _initialize_client(self) -> picsellia.Client:
         """
         Initializes the Picsellia client for API interaction.
@@ -79,14 +112,49 @@ class PicselliaContext(ABC):
             session.verify = os.getenv("REQUESTS_CA_BUNDLE")
         else:
             session = None
+        # The configured organization ID, organization_id itself may need the client
         return picsellia.Client(
             api_token=self.api_token,
             host=self.host,
-            organization_id=self.organization_id,
+            organization_id=self._organization_id,
             organization_name=self.organization_name,
             session=session,
         )
 
+    def _get_model_version_by_id(self, model_version_id: str) -> picsellia.ModelVersion:
+        """
+        Fetches a model version, memoized by ID for the lifetime of this context.
+
+        Args:
+            model_version_id (str): ID of the model version.
+
+        Returns:
+            picsellia.ModelVersion: The model version.
+        """
+        if model_version_id not in self._model_versions:
+            self._model_versions[model_version_id] = (
+                self.client.get_model_version_by_id(model_version_id)
+            )
+        return self._model_versions[model_version_id]
+
+    def _get_dataset_version_by_id(
+        self, dataset_version_id: str
+    ) -> picsellia.DatasetVersion:
+        """
+        Fetches a dataset version, memoized by ID for the lifetime of this context.
+
+        Args:
+            dataset_version_id (str): ID of the dataset version.
+
+        Returns:
+            picsellia.DatasetVersion: The dataset version.
+        """
+        if dataset_version_id not in self._dataset_versions:
+            self._dataset_versions[dataset_version_id] = (
+                self.client.get_dataset_version_by_id(dataset_version_id)
+            )
+        return self._dataset_versions[dataset_version_id]
+
     def _format_parameter_with_color_and_suffix(
         self, value: Any, key: str, defaulted_keys: set
     ) -> str:
@@ -133,6 +201,31 @@ class PicselliaContext(ABC):
             )
         return processed_params
 
+    def _build_context_dict(
+        self, context_parameters: dict[str, Any], **parameters: Parameters
+    ) -> dict[str, Any]:
+        """
+        Builds the dictionary representation shared by all contexts.
+
+        Args:
+            context_parameters (dict[str, Any]): Values of the "context_parameters" section.
+            **parameters (Parameters): Parameter sets to format, keyed by their section name.
+
+        Returns:
+            dict[str, Any]: The "context_parameters" section followed by one formatted section
+                per parameter set, in the order given.
+        """
+        return {
+            "context_parameters": context_parameters,
+            **{
+                name: self._process_parameters(
+                    parameters_dict=params.to_dict(),
+                    defaulted_keys=params.defaulted_keys,
+                )
+                for name, params in parameters.items()
+            },
+        }
+
     @abstractmethod
     def to_dict(self):
         """
@@ -1,5 +1,7 @@
 from typing import Any, Generic, TypeVar
 
+from picsellia import Client
+
 from picsellia_cv_engine.core.contexts import PicselliaContext
 from picsellia_cv_engine.core.parameters import Parameters
 
@@ -23,6 +25,7 @@ class PicselliaLocalProcessingContext(PicselliaContext, Generic[TParameters]):
         inputs: dict[str, Any] | None = None,
         use_id: bool | None = True,
         working_dir: str | None = None,
+        client: Client | None = None,
         **kwargs,
     ):
         super().__init__(
@@ -31,6 +34,7 @@ class PicselliaLocalProcessingContext(PicselliaContext, Generic[TParameters]):
             organization_id=organization_id,
             organization_name=organization_name,
             working_dir=working_dir,
+            client=client,
         )
 
         self.target_id = target_id
@@ -53,17 +57,15 @@ class PicselliaLocalProcessingContext(PicselliaContext, Generic[TParameters]):
         return self._working_dir_override
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "context_parameters": {
+        context_dict = self._build_context_dict(
+            context_parameters={
                 "host": self.host,
                 "organization_id": self.organization_id,
             },
-            "processing_parameters": self._process_parameters(
-                parameters_dict=self.processing_parameters.to_dict(),
-                defaulted_keys=self.processing_parameters.defaulted_keys,
-            ),
-            "inputs": self.inputs,
-        }
+            processing_parameters=self.processing_parameters,
+        )
+        context_dict["inputs"] = self.inputs
+        return context_dict
 
     def _load_legacy_inputs(self, **kwargs) -> None:
         """
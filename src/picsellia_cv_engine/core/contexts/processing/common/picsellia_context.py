@@ -1,7 +1,11 @@
 import os
-from typing import Any, Generic, TypeVar
+from typing import Any, ClassVar, Generic, TypeVar
 
+import orjson
 import picsellia  # type: ignore
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from picsellia_cv_engine.core.contexts import PicselliaContext
 from picsellia_cv_engine.core.parameters import Parameters
@@ -9,11 +13,26 @@ from picsellia_cv_engine.core.parameters import Parameters
 TParameters = TypeVar("TParameters", bound=Parameters)
 
 
+def _create_payload_session() -> requests.Session:
+    """Session with pooled keep-alive connections and retries for presigned URLs."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class PicselliaProcessingContext(PicselliaContext, Generic[TParameters]):
     """
     Base context for Picsellia processing jobs.
     """
 
+    _payload_session: ClassVar[requests.Session] = _create_payload_session()
+
     def __init__(
         self,
         processing_parameters_cls: type[TParameters],
@@ -24,6 +43,7 @@ class PicselliaProcessingContext(PicselliaContext, Generic[TParameters]):
         job_id: str | None = None,
         use_id: bool | None = True,
         working_dir: str | None = None,
+        client: picsellia.Client | None = None,
     ):
         super().__init__(
             api_token=api_token,
@@ -31,6 +51,7 @@ class PicselliaProcessingContext(PicselliaContext, Generic[TParameters]):
             organization_id=organization_id,
             organization_name=organization_name,
             working_dir=working_dir,
+            client=client,
         )
 
         self.job_id = job_id or os.environ.get("job_id")
@@ -67,18 +88,32 @@ class PicselliaProcessingContext(PicselliaContext, Generic[TParameters]):
         return os.path.join(os.getcwd(), f"job_{self.job_id}")
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "context_parameters": {
+        context_dict = self._build_context_dict(
+            context_parameters={
                 "host": self.host,
                 "organization_id": self.organization_id,
                 "job_id": self.job_id,
             },
-            "processing_parameters": self._process_parameters(
-                parameters_dict=self.processing_parameters.to_dict(),
-                defaulted_keys=self.processing_parameters.defaulted_keys,
-            ),
-            "inputs": self.inputs,
-        }
+            processing_parameters=self.processing_parameters,
+        )
+        context_dict["inputs"] = self.inputs
+        return context_dict
+
+    def _fetch_payload(self) -> dict[str, Any]:
+        """
+        Download and decode the JSON payload behind the job's presigned URL.
+
+        Raises:
+            ValueError: If the job has no payload presigned URL.
+        """
+        if not self.payload_presigned_url:
+            raise ValueError("Payload presigned URL not found.")
+        with self._payload_session.get(
+            self.payload_presigned_url, stream=True, timeout=(3.05, 30)
+        ) as response:
+            response.raise_for_status()
+            # Read the body in one go rather than joining requests' 10 KiB chunks
+            return orjson.loads(response.raw.read(decode_content=True))
 
     def _initialize_job(self) -> picsellia.Job:
         return self.client.get_job_by_id(self.job_id)
@@ -41,10 +41,11 @@ def create_processing(
         "docker_tag": docker_tag,
         "docker_flags": docker_flags,
     }
-    r = client.connexion.post(
-        f"/sdk/organization/{client.id}/processings", data=orjson.dumps(payload)
-    ).json()
-    return r["id"]
+    response = client.connexion.post(
+        f"/sdk/organization/{client.id}/processings",
+        data=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+    )
+    return orjson.loads(response.content)["id"]
 
 
 def get_processing(client: Client, name: str) -> str:
@@ -54,10 +55,10 @@ def get_processing(client: Client, name: str) -> str:
     Returns:
         str: ID of the found processing.
     """
-    r = client.connexion.get(
+    response = client.connexion.get(
         f"/sdk/organization/{client.id}/processings", params={"name": name}
-    ).json()
-    return r["items"][0]["id"]
+    )
+    return orjson.loads(response.content)["items"][0]["id"]
 
 
 def launch_processing(
@@ -89,11 +90,11 @@ def launch_processing(
     if target_datalake_name:
         payload["target_datalake_name"] = target_datalake_name
 
-    r = client.connexion.post(
+    response = client.connexion.post(
         f"/api/datalake/{datalake.id}/processing/launch",
-        data=orjson.dumps(payload),
-    ).json()
-    return Job(client.connexion, r, version=2)
+        data=orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY),
+    )
+    return Job(client.connexion, orjson.loads(response.content), version=2)
 
 
 class LocalDatalakeProcessingContext(
@@ -118,6 +119,7 @@ class LocalDatalakeProcessingContext(
         limit: int = 100,
         use_id: bool | None = True,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         """
         Initialize the local datalake processing context.
@@ -137,9 +139,11 @@ class LocalDatalakeProcessingContext(
             inputs=inputs,
             use_id=use_id,
             working_dir=working_dir,
+            client=client,
         )
 
-        self.target = self.client.get_datalake(id=self.target_id)
+        # target_id is the input datalake, already fetched by _load_legacy_inputs
+        self.target = self.input_datalake
 
         self.offset = offset
         self.limit = limit
@@ -174,7 +178,7 @@ class LocalDatalakeProcessingContext(
         details="get_model_version will be removed in a future version. Use the new input system instead."
     )
     def get_model_version(self) -> ModelVersion:
-        return self.client.get_model_version_by_id(self._model_version_id)
+        return self._get_model_version_by_id(self._model_version_id)
 
     def get_data_ids(self, offset: int, limit: int) -> list[UUID]:
         """List data IDs from a datalake with offset and limit."""
@@ -1,9 +1,8 @@
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-import requests
 from deprecation import deprecated
-from picsellia import Datalake, ModelVersion
+from picsellia import Client, Datalake, ModelVersion
 
 from picsellia_cv_engine.core.contexts.processing.common.picsellia_context import (
     PicselliaProcessingContext,
@@ -30,6 +29,7 @@ class PicselliaDatalakeProcessingContext(
         job_id: str | None = None,
         use_id: bool | None = True,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         super().__init__(
             processing_parameters_cls=processing_parameters_cls,
@@ -40,10 +40,12 @@ class PicselliaDatalakeProcessingContext(
             job_id=job_id,
             use_id=use_id,
             working_dir=working_dir,
+            client=client,
         )
 
         self.data_ids = self.get_data_ids()
-        self.target = self.client.get_datalake(id=self.target_id)
+        # target_id is the input datalake, already fetched by _load_legacy_inputs
+        self.target = self.input_datalake
 
     def get_data_ids(self) -> list[UUID]:
         """
@@ -52,10 +54,7 @@ class PicselliaDatalakeProcessingContext(
         Raises:
             ValueError: If the payload URL is missing or invalid.
         """
-        if not self.payload_presigned_url:
-            raise ValueError("Payload presigned URL not found.")
-        payload = requests.get(self.payload_presigned_url).json()
-        return [UUID(data_id) for data_id in payload["data_ids"]]
+        return list(map(UUID, self._fetch_payload()["data_ids"]))
 
     def to_dict(self) -> dict[str, Any]:
         base = super().to_dict()
@@ -97,4 +96,4 @@ class PicselliaDatalakeProcessingContext(
         details="get_model_version will be removed in a future version. Use the new input system instead."
     )
     def get_model_version(self) -> ModelVersion:
-        return self.client.get_model_version_by_id(self._model_version_id)
+        return self._get_model_version_by_id(self._model_version_id)
@@ -1,7 +1,7 @@
 from typing import Any, Generic, TypeVar
 
 from deprecation import deprecated
-from picsellia import DatasetVersion, ModelVersion
+from picsellia import Client, DatasetVersion, ModelVersion
 from picsellia.exceptions import ResourceConflictError
 from picsellia.types.enums import ProcessingType
 
@@ -34,6 +34,7 @@ class LocalDatasetProcessingContext(
         use_id: bool | None = True,
         download_annotations: bool | None = True,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         """
         Initialize the local processing context.
@@ -56,9 +57,15 @@ class LocalDatasetProcessingContext(
             inputs=inputs,
             use_id=use_id,
             working_dir=working_dir,
+            client=client,
         )
         self.asset_ids = None
-        self.target = self.client.get_dataset_version_by_id(id=self.target_id)
+        # target_id is the input dataset version already fetched by _load_legacy_inputs
+        self.target = (
+            self.input_dataset_version
+            if str(self.input_dataset_version.id) == str(self.target_id)
+            else self._get_dataset_version_by_id(self.target_id)
+        )
 
     def to_dict(self) -> dict[str, Any]:
         """Convert context to a dictionary for logging or serialization."""
@@ -97,13 +104,13 @@ class LocalDatasetProcessingContext(
         details="get_dataset_version will be removed in a future version. Use the new input system instead."
     )
     def get_dataset_version(self, dataset_version_id: str) -> DatasetVersion:
-        return self.client.get_dataset_version_by_id(dataset_version_id)
+        return self._get_dataset_version_by_id(dataset_version_id)
 
     @deprecated(
         details="get_model_version will be removed in a future version. Use the new input system instead."
     )
     def get_model_version(self) -> ModelVersion:
-        return self.client.get_model_version_by_id(self.model_version_id)
+        return self._get_model_version_by_id(self.model_version_id)
 
     @deprecated(
         details="get_or_create_target_dataset_version will be removed in a future version. Use the new input system instead."
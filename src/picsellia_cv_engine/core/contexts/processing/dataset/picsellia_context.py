@@ -1,9 +1,8 @@
 from typing import Any, Generic, TypeVar
 from uuid import UUID
 
-import requests
 from deprecation import deprecated
-from picsellia import DatasetVersion, ModelVersion
+from picsellia import Client, DatasetVersion, ModelVersion
 from picsellia.exceptions import ResourceConflictError
 
 from picsellia_cv_engine.core.contexts.processing.common.picsellia_context import (
@@ -28,6 +27,7 @@ class PicselliaDatasetProcessingContext(
         use_id: bool | None = True,
         download_annotations: bool | None = True,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         self.download_annotations = download_annotations
         super().__init__(
@@ -39,14 +39,19 @@ class PicselliaDatasetProcessingContext(
             job_id=job_id,
             use_id=use_id,
             working_dir=working_dir,
+            client=client,
         )
         self.asset_ids = self.get_asset_ids()
-        self.target = self.client.get_dataset_version_by_id(id=self.target_id)
+        # target_id is the input dataset version already fetched by _load_legacy_inputs
+        self.target = (
+            self.input_dataset_version
+            if str(self.input_dataset_version.id) == str(self.target_id)
+            else self._get_dataset_version_by_id(self.target_id)
+        )
 
     def get_asset_ids(self) -> list[UUID] | None:
         if self.payload_presigned_url:
-            payload = requests.get(self.payload_presigned_url).json()
-            return [UUID(asset_id) for asset_id in payload["asset_ids"]]
+            return list(map(UUID, self._fetch_payload()["asset_ids"]))
         return None
 
     def to_dict(self) -> dict[str, Any]:
@@ -98,13 +103,13 @@ class PicselliaDatasetProcessingContext(
         details="get_dataset_version will be removed in a future version. Use the new input system instead."
     )
     def get_dataset_version(self, dataset_version_id: str) -> DatasetVersion:
-        return self.client.get_dataset_version_by_id(dataset_version_id)
+        return self._get_dataset_version_by_id(dataset_version_id)
 
     @deprecated(
         details="get_model_version will be removed in a future version. Use the new input system instead."
     )
     def get_model_version(self) -> ModelVersion:
-        return self.client.get_model_version_by_id(self.model_version_id)
+        return self._get_model_version_by_id(self.model_version_id)
 
     @deprecated(
         details="get_or_create_target_dataset_version will be removed in a future version. Use the new input system instead."
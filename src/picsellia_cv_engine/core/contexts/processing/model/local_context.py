@@ -1,7 +1,7 @@
 from typing import Any, Generic, TypeVar
 
 from deprecation import deprecated
-from picsellia import ModelVersion
+from picsellia import Client, ModelVersion
 from picsellia.types.enums import ProcessingType
 
 from picsellia_cv_engine.core.contexts.processing.common.local_picsellia_context import (
@@ -27,6 +27,7 @@ class LocalModelProcessingContext(
         target_id: str | None = None,
         inputs: dict[str, Any] | None = None,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         self.job_type = job_type
         super().__init__(
@@ -39,8 +40,10 @@ class LocalModelProcessingContext(
             target_id=target_id,
             inputs=inputs,
             working_dir=working_dir,
+            client=client,
         )
-        self.target = self.client.get_model_version_by_id(id=self.target_id)
+        # target_id is the model version already fetched by _load_legacy_inputs
+        self.target = self.model_version
 
     def _load_legacy_inputs(self, **kwargs) -> None:
         self._model_version_id = self.target_id
@@ -61,7 +64,7 @@ class LocalModelProcessingContext(
         details="get_model_version will be removed in a future version. Use the new input system instead."
     )
     def get_model_version(self) -> ModelVersion:
-        return self.client.get_model_version_by_id(self._model_version_id)
+        return self._get_model_version_by_id(self._model_version_id)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert context to a dictionary for logging or serialization."""
@@ -1,7 +1,7 @@
 from typing import Any, Generic, TypeVar
 
 from deprecation import deprecated
-from picsellia import ModelVersion
+from picsellia import Client, ModelVersion
 
 from picsellia_cv_engine.core.contexts.processing.common.picsellia_context import (
     PicselliaProcessingContext,
@@ -22,6 +22,7 @@ class PicselliaModelProcessingContext(PicselliaProcessingContext, Generic[TParam
         job_id: str | None = None,
         use_id: bool | None = True,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         super().__init__(
             processing_parameters_cls=processing_parameters_cls,
@@ -32,9 +33,15 @@ class PicselliaModelProcessingContext(PicselliaProcessingContext, Generic[TParam
             job_id=job_id,
             use_id=use_id,
             working_dir=working_dir,
+            client=client,
         )
 
-        self.target = self.client.get_model_version_by_id(id=self.target_id)
+        # target_id is the model version already fetched by _load_legacy_inputs
+        self.target = (
+            self.model_version
+            if self._model_version_id
+            else self._get_model_version_by_id(self.target_id)
+        )
 
     def _load_legacy_inputs(self) -> None:
         self._model_version_id = self.target_id
@@ -61,4 +68,4 @@ class PicselliaModelProcessingContext(PicselliaProcessingContext, Generic[TParam
         details="get_model_version will be removed in a future version. Use the new input system instead."
     )
     def get_model_version(self) -> ModelVersion:
-        return self.client.get_model_version_by_id(self.model_version_id)
+        return self._get_model_version_by_id(self.model_version_id)
@@ -1,7 +1,8 @@
 import os
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
-from picsellia import Experiment
+from picsellia import Client, Experiment
 
 from picsellia_cv_engine.core.contexts import PicselliaContext
 from picsellia_cv_engine.core.parameters import (
@@ -37,6 +38,7 @@ class LocalTrainingContext(
         organization_name: str | None = None,
         experiment_id: str | None = None,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         """
         Initialize the training context using an experiment and parameter classes.
@@ -50,20 +52,40 @@ class LocalTrainingContext(
             organization_id=organization_id,
             organization_name=organization_name,
             working_dir=working_dir,
+            client=client,
         )
 
         self.experiment_id = experiment_id
         if self.experiment_id:
             self.experiment = self._initialize_experiment()
 
-        self.hyperparameters = hyperparameters_cls(log_data=hyperparameters or {})
-        self.augmentation_parameters = augmentation_parameters_cls(
-            log_data=augmentation_parameters or {}
-        )
-        self.export_parameters = export_parameters_cls(log_data=export_parameters or {})
+        # Parameter sets are parsed on first access, see the cached properties below
+        self._hyperparameters_cls = hyperparameters_cls
+        self._augmentation_parameters_cls = augmentation_parameters_cls
+        self._export_parameters_cls = export_parameters_cls
+        self._hyperparameters_data = hyperparameters or {}
+        self._augmentation_parameters_data = augmentation_parameters or {}
+        self._export_parameters_data = export_parameters or {}
 
         self._working_dir_override = working_dir
 
+    @cached_property
+    def hyperparameters(self) -> THyperParameters:
+        """Hyperparameters parsed from the values given at construction."""
+        return self._hyperparameters_cls(log_data=self._hyperparameters_data)
+
+    @cached_property
+    def augmentation_parameters(self) -> TAugmentationParameters:
+        """Augmentation parameters parsed from the values given at construction."""
+        return self._augmentation_parameters_cls(
+            log_data=self._augmentation_parameters_data
+        )
+
+    @cached_property
+    def export_parameters(self) -> TExportParameters:
+        """Export parameters parsed from the values given at construction."""
+        return self._export_parameters_cls(log_data=self._export_parameters_data)
+
     @property
     def working_dir(self) -> str:
         """Return the working directory path for the experiment."""
@@ -73,26 +95,17 @@ class LocalTrainingContext(
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the context to a dictionary representation."""
-        return {
-            "context_parameters": {
+        return self._build_context_dict(
+            context_parameters={
                 "host": self.host,
                 "organization_id": self.organization_id,
                 "organization_name": self.organization_name,
                 "experiment_id": self.experiment_id,
             },
-            "hyperparameters": self._process_parameters(
-                parameters_dict=self.hyperparameters.to_dict(),
-                defaulted_keys=self.hyperparameters.defaulted_keys,
-            ),
-            "augmentation_parameters": self._process_parameters(
-                parameters_dict=self.augmentation_parameters.to_dict(),
-                defaulted_keys=self.augmentation_parameters.defaulted_keys,
-            ),
-            "export_parameters": self._process_parameters(
-                parameters_dict=self.export_parameters.to_dict(),
-                defaulted_keys=self.export_parameters.defaulted_keys,
-            ),
-        }
+            hyperparameters=self.hyperparameters,
+            augmentation_parameters=self.augmentation_parameters,
+            export_parameters=self.export_parameters,
+        )
 
     def _initialize_experiment(self) -> Experiment:
         """Fetch the experiment by ID from Picsellia."""
@@ -1,7 +1,8 @@
 import os
+from functools import cached_property
 from typing import Any, Generic, TypeVar
 
-from picsellia import Experiment  # type: ignore
+from picsellia import Client, Experiment  # type: ignore
 
 from picsellia_cv_engine.core.contexts import PicselliaContext
 from picsellia_cv_engine.core.parameters import (
@@ -36,6 +37,7 @@ class PicselliaTrainingContext(
         organization_name: str | None = None,
         experiment_id: str | None = None,
         working_dir: str | None = None,
+        client: Client | None = None,
     ):
         """
         Initialize the training context with parameter classes and experiment data.
@@ -49,6 +51,7 @@ class PicselliaTrainingContext(
             organization_id=organization_id,
             organization_name=organization_name,
             working_dir=working_dir,
+            client=client,
         )
 
         self.experiment_id = experiment_id or os.getenv("experiment_id")
@@ -59,13 +62,32 @@ class PicselliaTrainingContext(
             )
 
         self.experiment = self._initialize_experiment()
-        parameters_log_data = self.experiment.get_log("parameters").data
 
-        self.hyperparameters = hyperparameters_cls(log_data=parameters_log_data)
-        self.augmentation_parameters = augmentation_parameters_cls(
-            log_data=parameters_log_data
-        )
-        self.export_parameters = export_parameters_cls(log_data=parameters_log_data)
+        # The parameters log is fetched and parsed on first access, see the cached
+        # properties below
+        self._hyperparameters_cls = hyperparameters_cls
+        self._augmentation_parameters_cls = augmentation_parameters_cls
+        self._export_parameters_cls = export_parameters_cls
+
+    @cached_property
+    def _parameters_log_data(self) -> Any:
+        """Data of the experiment's "parameters" log, shared by all parameter sets."""
+        return self.experiment.get_log("parameters").data
+
+    @cached_property
+    def hyperparameters(self) -> THyperParameters:
+        """Hyperparameters parsed from the experiment's parameters log."""
+        return self._hyperparameters_cls(log_data=self._parameters_log_data)
+
+    @cached_property
+    def augmentation_parameters(self) -> TAugmentationParameters:
+        """Augmentation parameters parsed from the experiment's parameters log."""
+        return self._augmentation_parameters_cls(log_data=self._parameters_log_data)
+
+    @cached_property
+    def export_parameters(self) -> TExportParameters:
+        """Export parameters parsed from the experiment's parameters log."""
+        return self._export_parameters_cls(log_data=self._parameters_log_data)
 
     @property
     def working_dir(self) -> str:
@@ -76,26 +98,17 @@ class PicselliaTrainingContext(
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the context to a dictionary representation."""
-        return {
-            "context_parameters": {
+        return self._build_context_dict(
+            context_parameters={
                 "host": self.host,
                 "organization_id": self.organization_id,
                 "organization_name": self.organization_name,
                 "experiment_id": self.experiment_id,
             },
-            "hyperparameters": self._process_parameters(
-                parameters_dict=self.hyperparameters.to_dict(),
-                defaulted_keys=self.hyperparameters.defaulted_keys,
-            ),
-            "augmentation_parameters": self._process_parameters(
-                parameters_dict=self.augmentation_parameters.to_dict(),
-                defaulted_keys=self.augmentation_parameters.defaulted_keys,
-            ),
-            "export_parameters": self._process_parameters(
-                parameters_dict=self.export_parameters.to_dict(),
-                defaulted_keys=self.export_parameters.defaulted_keys,
-            ),
-        }
+            hyperparameters=self.hyperparameters,
+            augmentation_parameters=self.augmentation_parameters,
+            export_parameters=self.export_parameters,
+        )
 
     def _initialize_experiment(self) -> Experiment:
         """Fetch the experiment by ID from Picsellia."""
@@ -1,9 +1,9 @@
-import json
 import logging
 import os
 import shutil
 from typing import Any
 
+import orjson
 from picsellia import DatasetVersion, Label
 from picsellia.exceptions import NoDataError
 from picsellia.sdk.asset import MultiAsset
@@ -218,6 +218,8 @@ class CocoDataset(BaseDataset):
         """
         Merge multiple COCO annotation batches into a single file.
 
+        The merged file is written with orjson and indented with 2 spaces.
+
         Args:
             batch_files (List[str]): Paths to the batch files.
             final_coco_file_path (str): Path to save the merged COCO file.
@@ -232,39 +234,39 @@ class CocoDataset(BaseDataset):
 
         with tqdm(batch_files, desc="Merging annotation batches", unit="batch") as pbar:
             for batch_file in pbar:
-                with open(batch_file) as f:
-                    batch_data = json.load(f)
+                with open(batch_file, "rb") as f:
+                    batch_data = orjson.loads(f.read())
 
-                for image in batch_data.get("images", []):
+                images = batch_data.get("images", [])
+                for image in images:
                     image["id"] += max_image_id
                     merged_coco_data["images"].append(image)
 
-                for annotation in batch_data.get("annotations", []):
+                annotations = batch_data.get("annotations", [])
+                for annotation in annotations:
                     annotation["id"] += max_annotation_id
                     annotation["image_id"] += max_image_id
                     merged_coco_data["annotations"].append(annotation)
 
-                if merged_coco_data["images"]:
-                    max_image_id = (
-                        max(img["id"] for img in merged_coco_data["images"]) + 1
+                # Earlier batches are already below the current offsets, so only the
+                # batch just merged can raise them
+                if images:
+                    max_image_id = max(
+                        max_image_id, max(img["id"] for img in images) + 1
                     )
-                else:
-                    max_image_id = 0
 
-                if merged_coco_data["annotations"]:
-                    max_annotation_id = (
-                        max(ann["id"] for ann in merged_coco_data["annotations"]) + 1
+                if annotations:
+                    max_annotation_id = max(
+                        max_annotation_id, max(ann["id"] for ann in annotations) + 1
                     )
-                else:
-                    max_annotation_id = 0
 
                 if not merged_coco_data["categories"]:
                     merged_coco_data["categories"] = batch_data.get("categories", [])
 
                 os.remove(batch_file)
 
-        with open(final_coco_file_path, "w") as f:
-            json.dump(merged_coco_data, f, indent=4)
+        with open(final_coco_file_path, "wb") as f:
+            f.write(orjson.dumps(merged_coco_data, option=orjson.OPT_INDENT_2))
         logger.info(f"Merged annotations saved to {final_coco_file_path}")
 
     def load_coco_file_data(self) -> dict[str, Any]:
@@ -283,8 +285,8 @@ class CocoDataset(BaseDataset):
                 "COCO file path is not set. Please download the COCO file first."
             )
         try:
-            with open(self.coco_file_path) as f:
-                coco_data = json.load(f)
+            with open(self.coco_file_path, "rb") as f:
+                coco_data = orjson.loads(f.read())
             logger.info(f"Successfully loaded COCO data from {self.coco_file_path}")
             return coco_data
         except Exception as e:
@@ -1,5 +1,6 @@
 import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, TypeVar
 
 from picsellia import Artifact, Experiment, Label, ModelFile, ModelVersion
@@ -101,48 +102,70 @@ class Model:
         """Set the runtime-loaded model instance."""
         self._loaded_model = model
 
-    def download_model_weights(self, destination_dir: str) -> None:
+    def download_model_weights(
+        self,
+        destination_dir: str,
+        model_files: list[ModelFile] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
         """
         Download all configured model files (weights, config, exports) to destination.
 
         Args:
             destination_dir (str): Root directory for downloaded files.
+            model_files (list[ModelFile] | None): Files of the model version, if already
+                listed by the caller. When omitted, they are listed from the model version.
+            max_workers (int | None): The number of destination directories downloaded to
+                concurrently. Files sharing a directory are always downloaded one after the other.
         """
         if self.model_version is None:
             raise ValueError(
                 f"No model version available for model '{self.name}', cannot download files."
             )
         self._prepare_directories(destination_dir)
-        self._do_download_files(dl_method=self.model_version.list_files)
+        if model_files is None:
+            self._do_download_files(
+                dl_method=self.model_version.list_files, max_workers=max_workers
+            )
+        else:
+            self._do_download_files(
+                dl_method=lambda: model_files, max_workers=max_workers
+            )
 
-    def download_experiment_weights(self, destination_dir: str) -> None:
+    def download_experiment_weights(
+        self, destination_dir: str, max_workers: int | None = None
+    ) -> None:
         """
         Download all configured artifact files (weights, config, exports) to destination.
 
         Args:
             destination_dir (str): Root directory for downloaded files.
+            max_workers (int | None): The number of destination directories downloaded to
+                concurrently. Files sharing a directory are always downloaded one after the other.
         """
         if self.experiment is None:
             raise ValueError(
                 f"No experiment available '{self.name}', cannot download files."
             )
         self._prepare_directories(destination_dir)
-        self._do_download_files(dl_method=self.experiment.list_artifacts)
+        self._do_download_files(
+            dl_method=self.experiment.list_artifacts, max_workers=max_workers
+        )
 
     def _prepare_directories(self, destination_dir: str) -> None:
         # Set destination directories
-        self.weights_dir = os.path.join(destination_dir, "weights")
+        weights_dir = self.weights_dir = os.path.join(destination_dir, "weights")
         self.results_dir = os.path.join(destination_dir, "results")
-        self.pretrained_weights_dir = os.path.join(
-            self.weights_dir, "pretrained_weights"
-        )
-        self.trained_weights_dir = os.path.join(self.weights_dir, "trained_weights")
-        self.config_dir = os.path.join(self.weights_dir, "config")
-        self.exported_weights_dir = os.path.join(self.weights_dir, "exported_weights")
-
-        # Create directories if they don't exist
+        # weights_dir never ends with a separator, so plain concatenation gives the
+        # same paths as os.path.join without its per-call checks
+        self.pretrained_weights_dir = f"{weights_dir}{os.sep}pretrained_weights"
+        self.trained_weights_dir = f"{weights_dir}{os.sep}trained_weights"
+        self.config_dir = f"{weights_dir}{os.sep}config"
+        self.exported_weights_dir = f"{weights_dir}{os.sep}exported_weights"
+
+        # Create directories if they don't exist. weights_dir is the parent of the
+        # four weights leaves, so makedirs on those creates it as well.
         for directory in [
-            self.weights_dir,
             self.results_dir,
             self.pretrained_weights_dir,
             self.trained_weights_dir,
@@ -151,50 +174,69 @@ class Model:
         ]:
             os.makedirs(directory, exist_ok=True)
 
-    def _do_download_files(  # noqa: C901
-        self, dl_method: Callable[[], list[ModelFile] | list[Artifact]]
+    def _do_download_files(
+        self,
+        dl_method: Callable[[], list[ModelFile] | list[Artifact]],
+        max_workers: int | None = None,
     ):
         downloader = ModelDownloader()
-        # Download and process files
+
+        # File name -> (label, target directory). setdefault keeps the first entry when
+        # names collide, like the former if/elif chain did.
+        dispatch: dict[str, tuple[str, str | None]] = {}
+        for name, target in (
+            (
+                self.pretrained_weights_name,
+                ("Pretrained weights", self.pretrained_weights_dir),
+            ),
+            (self.trained_weights_name, ("Trained weights", self.trained_weights_dir)),
+            (self.config_name, ("Config", self.config_dir)),
+            (
+                self.exported_weights_name,
+                ("Exported weights", self.exported_weights_dir),
+            ),
+        ):
+            if name is not None:
+                dispatch.setdefault(name, target)
+
+        # Group the files by target directory, in listing order. Downloading and extracting
+        # into the same directory from several threads could race, so each directory is
+        # handled by a single worker while different directories are downloaded concurrently.
+        files_by_directory: dict[str, list[ModelFile | Artifact]] = {}
         for file in dl_method():
-            if file.name == self.pretrained_weights_name:
-                if not self.pretrained_weights_dir:
-                    raise ValueError(
-                        "Pretrained weights directory is not set. Cannot download pretrained weights."
-                    )
-                self.pretrained_weights_path = downloader.download_and_process(
-                    file, self.pretrained_weights_dir
-                )
-            elif file.name == self.trained_weights_name:
-                if not self.trained_weights_dir:
-                    raise ValueError(
-                        "Trained weights directory is not set. Cannot download trained weights."
-                    )
-                self.trained_weights_path = downloader.download_and_process(
-                    file, self.trained_weights_dir
-                )
-            elif file.name == self.config_name:
-                if not self.config_dir:
-                    raise ValueError(
-                        "Config directory is not set. Cannot download config file."
-                    )
-                self.config_path = downloader.download_and_process(
-                    file, self.config_dir
-                )
-            elif file.name == self.exported_weights_name:
-                if not self.exported_weights_dir:
-                    raise ValueError(
-                        "Exported weights directory is not set. Cannot download exported weights."
-                    )
-                self.exported_weights_path = downloader.download_and_process(
-                    file, self.exported_weights_dir
+            label, directory = dispatch.get(file.name, ("Weights", self.weights_dir))
+            if not directory:
+                raise ValueError(
+                    f"{label} directory is not set. Cannot download {file.name}."
                 )
-            else:
-                if not self.weights_dir:
-                    raise ValueError(
-                        "Weights directory is not set. Cannot download model file."
-                    )
-                downloader.download_and_process(file, self.weights_dir)
+            files_by_directory.setdefault(directory, []).append(file)
+
+        def download_directory(
+            directory: str, files: list[ModelFile | Artifact]
+        ) -> list[tuple[str, str]]:
+            return [
+                (file.name, downloader.download_and_process(file, directory))
+                for file in files
+            ]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(download_directory, directory, files)
+                for directory, files in files_by_directory.items()
+            ]
+            downloaded = [item for future in futures for item in future.result()]
+
+        # Files sharing a name share a directory, so they come back in listing order and
+        # the last one listed sets the path, as in a sequential loop
+        for file_name, downloaded_path in downloaded:
+            if file_name == self.pretrained_weights_name:
+                self.pretrained_weights_path = downloaded_path
+            elif file_name == self.trained_weights_name:
+                self.trained_weights_path = downloaded_path
+            elif file_name == self.config_name:
+                self.config_path = downloaded_path
+            elif file_name == self.exported_weights_name:
+                self.exported_weights_path = downloaded_path
 
     def save_artifact_to_experiment(
         self, artifact_name: str, artifact_path: str
@@ -1,5 +1,8 @@
 import os
 from typing import Any, Generic, TypeVar
+from uuid import UUID
+
+from picsellia import ModelFile
 
 from .model import Model
 
@@ -73,9 +76,18 @@ class ModelCollection(Generic[TModel]):
         Args:
             destination_dir (str): Base directory where weights will be saved.
         """
+        # Models built on the same model version share a single file listing
+        model_files_by_version: dict[UUID, list[ModelFile]] = {}
         for model in self:
+            model_files = None
+            if model.model_version is not None:
+                model_files = model_files_by_version.get(model.model_version.id)
+                if model_files is None:
+                    model_files = model.model_version.list_files()
+                    model_files_by_version[model.model_version.id] = model_files
             model.download_model_weights(
-                destination_dir=os.path.join(destination_dir, model.name)
+                destination_dir=os.path.join(destination_dir, model.name),
+                model_files=model_files,
             )
 
 
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from picsellia import Asset, Label
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaLabel:
     """Label associated with a prediction."""
 
@@ -18,14 +18,14 @@ class PicselliaLabel:
         return self.value.id
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaConfidence:
     """Confidence score for a prediction (typically between 0 and 1)."""
 
     value: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaRectangle:
     """Bounding box in [x, y, width, height] format."""
 
@@ -52,14 +52,14 @@ class PicselliaRectangle:
         return self.value[3]
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaText:
     """Recognized text from OCR predictions."""
 
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaPolygon:
     """Polygon represented by a list of points."""
 
@@ -80,7 +80,7 @@ class PicselliaPolygon:
         return Polygon(self.points).area if self.points else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaClassificationPrediction:
     """Prediction result for classification tasks."""
 
@@ -89,7 +89,7 @@ class PicselliaClassificationPrediction:
     confidence: PicselliaConfidence
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaRectanglePrediction:
     """Prediction result for object detection (rectangles)."""
 
@@ -99,7 +99,7 @@ class PicselliaRectanglePrediction:
     confidences: list[PicselliaConfidence]
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaOCRPrediction:
     """Prediction result for OCR tasks."""
 
@@ -110,7 +110,7 @@ class PicselliaOCRPrediction:
     confidences: list[PicselliaConfidence]
 
 
-@dataclass
+@dataclass(slots=True)
 class PicselliaPolygonPrediction:
     """Prediction result for segmentation tasks."""
 
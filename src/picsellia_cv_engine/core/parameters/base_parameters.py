@@ -1,6 +1,8 @@
 import logging
 from abc import ABC
 from enum import Enum
+from functools import cache
+from types import NoneType, UnionType
 from typing import (
     Any,
     Generic,
@@ -18,6 +20,41 @@ from picsellia_cv_engine.core import Colors
 logger = logging.getLogger("picsellia-engine")
 T = TypeVar("T")
 
+# Instance attributes holding parser state rather than parameters, hidden from to_dict
+_INTERNAL_ATTRIBUTES = frozenset({"parameters_data", "defaulted_keys"})
+
+# Accepted spellings of boolean and null values, compared lowercased
+_TRUE_STRINGS = frozenset({"1", "true", "yes"})
+_FALSE_STRINGS = frozenset({"0", "false", "no"})
+_NONE_STRINGS = frozenset({"none", "null"})
+
+# Marks a key absent from the parameters data, since None is a valid parameter value
+_MISSING = object()
+
+
+@cache
+def _resolve_type(expected_type: Any) -> tuple[bool, Any]:
+    """
+    Split an expected type into its optional flag and base type.
+
+    For instance, ``Union[int, None]`` and ``int | None`` resolve to ``(True, int)`` and ``int`` to ``(False, int)``.
+    Results are memoized, as parameter classes resolve the same few types over and over.
+    """
+    args = get_args(expected_type)
+    is_optional = get_origin(expected_type) in (Union, UnionType) and NoneType in args
+    base_type = (
+        next((arg for arg in args if arg is not NoneType), expected_type)
+        if is_optional
+        else expected_type
+    )
+    return is_optional, base_type
+
+
+@cache
+def _is_enum_type(expected_type: Any) -> bool:
+    """Check whether the expected type is an Enum subclass. Results are memoized."""
+    return isinstance(expected_type, type) and issubclass(expected_type, Enum)
+
 
 class Parameters(ABC, Generic[T]):
     """
@@ -114,28 +151,26 @@ class Parameters(ABC, Generic[T]):
             )
 
         # Determine if the type is optional
-        origin = get_origin(expected_type)
-        args = get_args(expected_type)
-        is_optional = origin is Union and any(isinstance(None, arg) for arg in args)
-        base_type = (
-            next((arg for arg in args if not isinstance(None, arg)), expected_type)
-            if is_optional
-            else expected_type
-        )
+        is_optional, base_type = _resolve_type(expected_type)  # type: ignore[arg-type]
 
         self._validate_default_value(default, base_type, is_optional, expected_type)
 
         for key in keys:
-            if key in self.parameters_data:
+            value = self.parameters_data.get(key, _MISSING)
+            if value is not _MISSING:
                 return self._process_parameter_value(
-                    key, expected_type, base_type, range_value, is_optional
+                    key, value, expected_type, base_type, range_value, is_optional
                 )
 
         return self._handle_missing_parameter(keys, expected_type, default, range_value)
 
     def _validate_default_value(self, default, base_type, is_optional, expected_type):
         # Check if the default value matches the expected type
-        if default is not ... and not isinstance(default, base_type | type(None)):
+        if (
+            default is not ...
+            and default is not None
+            and not isinstance(default, base_type)
+        ):
             raise TypeError(
                 f"The provided default value {default} does not match the expected type {expected_type}."
             )
@@ -146,9 +181,8 @@ class Parameters(ABC, Generic[T]):
             )
 
     def _process_parameter_value(
-        self, key, expected_type, base_type, range_value, is_optional
+        self, key, value, expected_type, base_type, range_value, is_optional
     ):
-        value = self.parameters_data[key]
         parsed_value = self._flexible_type_check(
             value, base_type, is_optional=is_optional
         )
@@ -159,7 +193,7 @@ class Parameters(ABC, Generic[T]):
             )
 
         if parsed_value is not None:
-            if isinstance(expected_type, type) and issubclass(expected_type, Enum):
+            if _is_enum_type(expected_type):
                 try:
                     return expected_type(parsed_value)
                 except ValueError:
@@ -205,12 +239,13 @@ class Parameters(ABC, Generic[T]):
 
     def to_dict(self) -> dict[str, Any]:
         """Return parameters as a dictionary, excluding internal fields."""
-        filtered_dict = {
-            key: value
-            for key, value in self.__dict__.items()
-            if key not in ["parameters_data", "defaulted_keys"]
+        # Sort the bare keys rather than (key, value) pairs, and build the dict once
+        attributes = self.__dict__
+        return {
+            key: attributes[key]
+            for key in sorted(attributes)
+            if key not in _INTERNAL_ATTRIBUTES
         }
-        return dict(sorted(filtered_dict.items()))
 
     def validate_log_data(self, log_data: LogDataType) -> dict[str, Any]:
         """Validate and return log data if it's a dictionary."""
@@ -232,7 +267,7 @@ class Parameters(ABC, Generic[T]):
         elif expected_type is int:
             return self._check_int(value)
 
-        elif isinstance(expected_type, type) and issubclass(expected_type, Enum):
+        elif _is_enum_type(expected_type):  # type: ignore[arg-type]
             return self._check_enum(value, expected_type, is_optional)
 
         elif value is None and not is_optional:
@@ -248,9 +283,10 @@ class Parameters(ABC, Generic[T]):
     def _check_bool(self, value: Any) -> bool:
         if isinstance(value, bool):
             return value
-        if str(value).lower() in ["1", "true", "yes"]:
+        lowered_value = str(value).lower()
+        if lowered_value in _TRUE_STRINGS:
             return True
-        if str(value).lower() in ["0", "false", "no"]:
+        if lowered_value in _FALSE_STRINGS:
             return False
 
         raise ValueError(
@@ -259,6 +295,8 @@ class Parameters(ABC, Generic[T]):
         )
 
     def _check_float(self, value: Any) -> float:
+        if type(value) is float:
+            return value  # Already a float, the common case
         if isinstance(value, int | float):
             return float(value)  # Directly converts int to float or maintains float
         try:
@@ -320,8 +358,9 @@ class Parameters(ABC, Generic[T]):
     def _check_optional(self, value: Any) -> Any:
         if value is None:
             return value
-        elif str(value).lower() in ["none", "null"]:
+        elif str(value).lower() in _NONE_STRINGS:
             return None
+        return value
 
     def _validate_range(self, value_range: tuple) -> tuple:
         """Ensure range is valid and return it."""
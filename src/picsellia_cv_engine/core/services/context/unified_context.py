@@ -1,5 +1,6 @@
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, Literal, TypeAlias, cast
+from typing import Any, Literal, TypeAlias
 
 from picsellia.types.enums import ProcessingType
 from toml import load as load_toml
@@ -33,11 +34,11 @@ from picsellia_cv_engine.core.services.context.picsellia_context import (
     create_picsellia_training_context,
 )
 from picsellia_cv_engine.core.services.context.processing_groups import (
+    DATALAKE_PROCESSING_TYPES,
+    DATASET_PROCESSING_TYPES,
     DATASET_VERSION_OUTPUT_TYPES,
+    MODEL_PROCESSING_TYPES,
     PRE_ANNOTATION_LIKE_TYPES,
-    is_datalake_processing,
-    is_dataset_processing,
-    is_model_processing,
 )
 
 Mode = Literal["local", "picsellia"]
@@ -51,6 +52,18 @@ ProcessingConfig: TypeAlias = (
     | ModelProcessConfig
 )
 
+# Each processing type is dispatched through lookup tables, this one and the context
+# factories below: one lookup instead of a chain of group checks, and supporting a
+# new type is a single entry per table.
+_PROCESSING_CONFIG_CLASSES: dict[ProcessingType, type[ProcessingConfig]] = {
+    ProcessingType.PRE_ANNOTATION: PreAnnotationConfig,
+    ProcessingType.AUTO_ANNOTATION: AutoAnnotationConfig,
+    ProcessingType.DATASET_VERSION_CREATION: DatasetVersionCreationConfig,
+    ProcessingType.DATA_AUGMENTATION: DataAugmentationConfig,
+    **dict.fromkeys(DATALAKE_PROCESSING_TYPES, DataAutoTaggingConfig),
+    **dict.fromkeys(MODEL_PROCESSING_TYPES, ModelProcessConfig),
+}
+
 
 def _load_and_validate_processing_config(
     config_file: str | Path, processing_type: ProcessingType
@@ -59,22 +72,13 @@ def _load_and_validate_processing_config(
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
-    raw = load_toml(path)
+    config_cls = _PROCESSING_CONFIG_CLASSES.get(processing_type)
+    if config_cls is None:
+        raise RuntimeError(f"Unsupported processing type: {processing_type}")
 
-    if processing_type == ProcessingType.PRE_ANNOTATION:
-        return PreAnnotationConfig(**raw)
-    if processing_type == ProcessingType.AUTO_ANNOTATION:
-        return AutoAnnotationConfig(**raw)
-    if processing_type == ProcessingType.DATASET_VERSION_CREATION:
-        return DatasetVersionCreationConfig(**raw)
-    if processing_type == ProcessingType.DATA_AUGMENTATION:
-        return DataAugmentationConfig(**raw)
-    if is_datalake_processing(processing_type):
-        return DataAutoTaggingConfig(**raw)
-    if is_model_processing(processing_type):
-        return ModelProcessConfig(**raw)
+    raw = load_toml(path)
 
-    raise RuntimeError(f"Unsupported processing type: {processing_type}")
+    return config_cls(**raw)
 
 
 def _load_and_validate_training_config(config_file: str | Path) -> TrainingConfig:
@@ -222,37 +226,42 @@ def _build_model_local_context(
     )
 
 
+_LOCAL_CONTEXT_BUILDERS: dict[ProcessingType, Callable[..., Any]] = {
+    **dict.fromkeys(
+        PRE_ANNOTATION_LIKE_TYPES, _build_pre_annotation_like_local_context
+    ),
+    **dict.fromkeys(
+        DATASET_VERSION_OUTPUT_TYPES, _build_dataset_version_output_local_context
+    ),
+    **dict.fromkeys(DATALAKE_PROCESSING_TYPES, _build_datalake_local_context),
+    **dict.fromkeys(MODEL_PROCESSING_TYPES, _build_model_local_context),
+}
+
+_PICSELLIA_CONTEXT_FACTORIES: dict[ProcessingType, Callable[..., Any]] = {
+    **dict.fromkeys(
+        DATASET_PROCESSING_TYPES, create_picsellia_dataset_processing_context
+    ),
+    **dict.fromkeys(
+        DATALAKE_PROCESSING_TYPES, create_picsellia_datalake_processing_context
+    ),
+    **dict.fromkeys(MODEL_PROCESSING_TYPES, create_picsellia_model_processing_context),
+}
+
+
 def _create_local_processing_context_from_config(
     config: ProcessingConfig,
     processing_type: ProcessingType,
     processing_parameters_cls: type[TParameters],
 ):
-    if processing_type in PRE_ANNOTATION_LIKE_TYPES:
-        return _build_pre_annotation_like_local_context(
-            config=cast(PreAnnotationConfig | AutoAnnotationConfig, config),
-            processing_type=processing_type,
-            processing_parameters_cls=processing_parameters_cls,
+    build_local_context = _LOCAL_CONTEXT_BUILDERS.get(processing_type)
+    if build_local_context is None:
+        raise RuntimeError(
+            f"Unsupported processing type for local context: {processing_type}"
         )
-    if processing_type in DATASET_VERSION_OUTPUT_TYPES:
-        return _build_dataset_version_output_local_context(
-            config=cast(DatasetVersionCreationConfig | DataAugmentationConfig, config),
-            processing_type=processing_type,
-            processing_parameters_cls=processing_parameters_cls,
-        )
-    if is_datalake_processing(processing_type):
-        return _build_datalake_local_context(
-            config=cast(DataAutoTaggingConfig, config),
-            processing_type=processing_type,
-            processing_parameters_cls=processing_parameters_cls,
-        )
-    if is_model_processing(processing_type):
-        return _build_model_local_context(
-            config=cast(ModelProcessConfig, config),
-            processing_type=processing_type,
-            processing_parameters_cls=processing_parameters_cls,
-        )
-    raise RuntimeError(
-        f"Unsupported processing type for local context: {processing_type}"
+    return build_local_context(
+        config=config,
+        processing_type=processing_type,
+        processing_parameters_cls=processing_parameters_cls,
     )
 
 
@@ -263,19 +272,12 @@ def create_processing_context_from_config(
     config_file_path: str | Path | None = None,
 ):
     if mode == "picsellia":
-        if is_dataset_processing(processing_type):
-            return create_picsellia_dataset_processing_context(
-                processing_parameters_cls=processing_parameters_cls,
-            )
-        if is_datalake_processing(processing_type):
-            return create_picsellia_datalake_processing_context(
-                processing_parameters_cls=processing_parameters_cls,
-            )
-        if is_model_processing(processing_type):
-            return create_picsellia_model_processing_context(
-                processing_parameters_cls=processing_parameters_cls,
-            )
-        raise RuntimeError(f"Unsupported processing type: {processing_type}")
+        create_picsellia_context = _PICSELLIA_CONTEXT_FACTORIES.get(processing_type)
+        if create_picsellia_context is None:
+            raise RuntimeError(f"Unsupported processing type: {processing_type}")
+        return create_picsellia_context(
+            processing_parameters_cls=processing_parameters_cls,
+        )
 
     if config_file_path is None:
         raise ValueError("Config file path must be provided for local mode")
@@ -1,6 +1,6 @@
-import json
 import os
 
+import orjson
 from picsellia import Datalake
 from picsellia.types.enums import ImportAnnotationMode, InferenceType
 
@@ -36,8 +36,8 @@ def initialize_coco_data(dataset: CocoDataset):
         dataset.coco_file_path = os.path.join(
             dataset.annotations_dir, "annotations.json"
         )
-        with open(dataset.coco_file_path, "w") as f:
-            json.dump(dataset.coco_data, f)
+        with open(dataset.coco_file_path, "wb") as f:
+            f.write(orjson.dumps(dataset.coco_data, option=orjson.OPT_SERIALIZE_NUMPY))
 
     if dataset.coco_file_path and not dataset.coco_data:
         dataset.coco_data = dataset.load_coco_file_data()
@@ -113,6 +113,16 @@ def upload_annotations(
 
     Supports Classification, Object Detection, and Segmentation inference types.
     """
+    # Importing a file without annotations nor categories is a no-op, unless it replaces
+    # existing annotations. Categories alone may still create labels on the dataset version.
+    if (
+        not replace_annotations
+        and dataset.coco_data is not None
+        and not dataset.coco_data.get("annotations")
+        and not dataset.coco_data.get("categories")
+    ):
+        return
+
     dataset.dataset_version.import_annotations_coco_file(
         file_path=dataset.coco_file_path,
         use_id=use_id,
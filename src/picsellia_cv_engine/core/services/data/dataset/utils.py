@@ -37,15 +37,19 @@ def _dataset_ann_dir(base: str, ann_dir_name: str) -> str:
 def _prefetch_assets_for_context(
     context: PicselliaDatasetProcessingContext | LocalDatasetProcessingContext,
     dataset_version,
+    skip_asset_listing: bool = False,
 ):
     """
     Return a MultiAsset for the given dataset_version:
       - If the context exposes `asset_ids`, call `list_assets(ids=asset_ids)`.
-      - Otherwise, call `list_assets()`.
+      - Otherwise, return None when `skip_asset_listing` is set, and call `list_assets()` if not.
 
     If no assets are found, log a warning and re-raise NoDataError (so callers can decide).
     """
     asset_ids: Sequence[str | UUID] | None = getattr(context, "asset_ids", None)
+    if not asset_ids and skip_asset_listing:
+        # The whole dataset version gets downloaded without listing its assets
+        return None
 
     try:
         if asset_ids:
@@ -133,7 +137,7 @@ def _load_processing_datasets(
         # Prefetch filtered assets (MultiAsset) for input if asset_ids were provided
         try:
             input_assets = _prefetch_assets_for_context(
-                context, context.input_dataset_version
+                context, context.input_dataset_version, skip_asset_listing
             )
         except NoDataError:
             # Keep going: create dataset with no preloaded assets; downloads may still succeed
@@ -171,7 +175,7 @@ def _load_processing_datasets(
     ):
         try:
             assets = _prefetch_assets_for_context(
-                context, context.input_dataset_version
+                context, context.input_dataset_version, skip_asset_listing
             )
         except NoDataError:
             logger.warning(
@@ -107,6 +107,7 @@ def generate_coco_predictions(
     gt_image_ids = {img["id"] for img in gt_coco.loadImgs(gt_coco.getImgIds())}
 
     images, annotations = [], []
+    seen_images: set[tuple] = set()
     annotation_id = 1
     label_counter = len(label_name_map)
 
@@ -127,7 +128,10 @@ def generate_coco_predictions(
             "width": asset_info["data"]["meta"]["width"],
             "height": asset_info["data"]["meta"]["height"],
         }
-        if image_info not in images:
+        # Hash lookup rather than comparing against every image added so far
+        image_key = tuple(image_info.values())
+        if image_key not in seen_images:
+            seen_images.add(image_key)
             images.append(image_info)
 
         for pred in extract_prediction_list(evaluation_info, inference_type):
@@ -1,6 +1,10 @@
 import os
 from abc import ABC
 from typing import Generic, TypeVar
+from uuid import UUID
+
+import numpy as np
+from picsellia import Asset
 
 from picsellia_cv_engine.core import Model
 from picsellia_cv_engine.core.data import TBaseDataset
@@ -36,6 +40,9 @@ class ModelPredictor(ABC, Generic[TModel]):
         """
         self.model: TModel = model
 
+        # Labels already resolved, keyed on (dataset version ID, category name)
+        self._label_cache: dict[tuple[UUID, str], PicselliaLabel] = {}
+
         if not hasattr(self.model, "loaded_model"):
             raise ValueError("The models does not have a loaded models attribute.")
 
@@ -65,12 +72,46 @@ class ModelPredictor(ABC, Generic[TModel]):
             for i in range(0, len(image_paths), batch_size)
         ]
 
+    def get_assets_by_image_path(
+        self, image_paths: list[str], dataset: TBaseDataset
+    ) -> dict[str, Asset]:
+        """
+        Fetch the assets of several images with a single dataset version request.
+
+        Image files are expected to be named after their asset ID, as in downloaded datasets.
+        Each path is parsed once, so callers can look assets up by path without re-parsing it.
+
+        Args:
+            image_paths (list[str]): Paths of the images, named `<asset_id>.<extension>`.
+            dataset (TBaseDataset): Dataset whose version holds the assets.
+
+        Returns:
+            dict[str, Asset]: The assets, keyed on their image path.
+        """
+        asset_ids_by_path = {
+            image_path: os.path.splitext(os.path.basename(image_path))[0]
+            for image_path in image_paths
+        }
+        if not asset_ids_by_path:
+            return {}
+        assets = dataset.dataset_version.list_assets(
+            ids=list(dict.fromkeys(asset_ids_by_path.values()))
+        )
+        assets_by_id = {str(asset.id): asset for asset in assets}
+        return {
+            image_path: assets_by_id[asset_id]
+            for image_path, asset_id in asset_ids_by_path.items()
+        }
+
     def get_picsellia_label(
         self, category_name: str, dataset: TBaseDataset
     ) -> PicselliaLabel:
         """
         Get or create a PicselliaLabel from a dataset category name.
 
+        Labels are cached per dataset version, so each category is only fetched from
+        Picsellia once per predictor.
+
         Args:
             category_name (str): The name of the label category.
             dataset (TBaseDataset): Dataset that provides label access.
@@ -78,9 +119,13 @@ class ModelPredictor(ABC, Generic[TModel]):
         Returns:
             PicselliaLabel: Wrapped label object.
         """
-        return PicselliaLabel(
-            dataset.dataset_version.get_or_create_label(category_name)
-        )
+        key = (dataset.dataset_version.id, category_name)
+        label = self._label_cache.get(key)
+        if label is None:
+            label = self._label_cache[key] = PicselliaLabel(
+                dataset.dataset_version.get_or_create_label(category_name)
+            )
+        return label
 
     def get_picsellia_confidence(self, confidence: float) -> PicselliaConfidence:
         """
@@ -110,3 +155,32 @@ class ModelPredictor(ABC, Generic[TModel]):
             PicselliaRectangle: Rectangle wrapper for object detection.
         """
         return PicselliaRectangle(x=x, y=y, w=w, h=h)
+
+    def get_picsellia_confidences(
+        self, confidences: np.ndarray
+    ) -> list[PicselliaConfidence]:
+        """
+        Wrap an array of confidence scores in PicselliaConfidence objects.
+
+        Args:
+            confidences (np.ndarray): Prediction confidence scores, of shape (N,).
+
+        Returns:
+            list[PicselliaConfidence]: One wrapped confidence object per score.
+        """
+        return [PicselliaConfidence(confidence) for confidence in confidences.tolist()]
+
+    def get_picsellia_rectangles(self, coords: np.ndarray) -> list[PicselliaRectangle]:
+        """
+        Create PicselliaRectangles from an array of bounding box coordinates.
+
+        The array is converted to Python values in a single call rather than one
+        element at a time.
+
+        Args:
+            coords (np.ndarray): Boxes in [x, y, width, height] format, of shape (N, 4).
+
+        Returns:
+            list[PicselliaRectangle]: One rectangle wrapper per box.
+        """
+        return [PicselliaRectangle(x, y, w, h) for x, y, w, h in coords.tolist()]
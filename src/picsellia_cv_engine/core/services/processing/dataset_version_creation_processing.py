@@ -1,9 +1,43 @@
+import logging
+import os
+import time
 from abc import abstractmethod
 
 from picsellia import Client, Data, Datalake, DatasetVersion
 from picsellia.services.error_manager import ErrorManager
 from picsellia.types.enums import InferenceType
 
+logger = logging.getLogger(__name__)
+
+
+def _split_image_paths(image_paths: list[str]) -> tuple[list[str], list[str]]:
+    """
+    Deduplicates image paths and separates readable files from missing or empty ones, in a single pass.
+
+    Args:
+        image_paths (list[str]): The image file paths, possibly with duplicates.
+
+    Returns:
+        - list[str]: The unique paths of non-empty files, in first occurrence order.
+        - list[str]: The unique paths that are missing, unreadable or empty.
+    """
+    seen: set[str] = set()
+    readable_paths: list[str] = []
+    unreadable_paths: list[str] = []
+    for path in image_paths:
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            is_readable = os.stat(path).st_size > 0
+        except OSError:
+            is_readable = False
+        if is_readable:
+            readable_paths.append(path)
+        else:
+            unreadable_paths.append(path)
+    return readable_paths, unreadable_paths
+
 
 class DatasetVersionCreationProcessing:
     """
@@ -51,8 +85,34 @@ class DatasetVersionCreationProcessing:
         """
         self.output_dataset_version.update(type=inference_type)
 
+    def update_output_dataset_version_metadata(
+        self,
+        description: str | None = None,
+        inference_type: InferenceType | None = None,
+    ) -> None:
+        """
+        Updates the description and/or inference type of the output dataset version in a single request.
+        Subclasses setting both fields should call this instead of the two single-field updates.
+
+        Args:
+            description (str | None): The new description to set, if any.
+            inference_type (InferenceType | None): The new inference type to set, if any.
+
+        """
+        kwargs = {
+            key: value
+            for key, value in (("description", description), ("type", inference_type))
+            if value is not None
+        }
+        if not kwargs:
+            return
+        self.output_dataset_version.update(**kwargs)
+
     def _upload_data_with_error_manager(
-        self, images_to_upload: list[str], images_tags: list[str] | None = None
+        self,
+        images_to_upload: list[str],
+        images_tags: list[str] | None = None,
+        max_workers: int | None = None,
     ) -> tuple[list[Data], list[str]]:
         """
         Uploads data to the datalake using an error manager. This method allows to handle errors during the upload process.
@@ -61,6 +121,8 @@ class DatasetVersionCreationProcessing:
         Args:
             images_to_upload (list[str]): The list of image file paths to upload.
             images_tags (Optional[list[str]]): The list of tags to associate with the images.
+            max_workers (Optional[int]): The number of threads uploading files concurrently.
+                Defaults to the Picsellia SDK default.
 
         Returns:
             - list[Data]: The list of uploaded data.
@@ -68,7 +130,10 @@ class DatasetVersionCreationProcessing:
         """
         error_manager = ErrorManager()
         data = self.datalake.upload_data(
-            filepaths=images_to_upload, tags=images_tags, error_manager=error_manager
+            filepaths=images_to_upload,
+            tags=images_tags,
+            max_workers=max_workers,
+            error_manager=error_manager,
         )
 
         if isinstance(data, Data):
@@ -84,6 +149,7 @@ class DatasetVersionCreationProcessing:
         images_to_upload: list[str],
         images_tags: list[str] | None = None,
         max_retries: int = 5,
+        max_workers: int | None = None,
     ) -> list[Data]:
         """
         Uploads images to the datalake. This method allows to handle errors during the upload process.
@@ -92,25 +158,50 @@ class DatasetVersionCreationProcessing:
             images_to_upload (list[str]): The list of image file paths to upload.
             images_tags (Optional[list[str]]): The list of tags to associate with the images.
             max_retries (int): The maximum number of retries to upload the images.
+            max_workers (Optional[int]): The number of threads uploading files concurrently,
+                for the first attempt and every retry. Defaults to the Picsellia SDK default.
 
         Returns:
 
         """
-        all_uploaded_data = []
-        uploaded_data, error_paths = self._upload_data_with_error_manager(
-            images_to_upload=images_to_upload, images_tags=images_tags
+        readable_paths, unreadable_paths = _split_image_paths(images_to_upload)
+        duplicate_count = (
+            len(images_to_upload) - len(readable_paths) - len(unreadable_paths)
         )
-        all_uploaded_data.extend(uploaded_data)
+        if duplicate_count:
+            logger.debug(f"Skipping {duplicate_count} duplicate image paths.")
+        # Missing or empty files can never be uploaded: fail before uploading anything
+        if unreadable_paths:
+            raise Exception(
+                f"The following images are missing or empty, no image was uploaded: "
+                f"{unreadable_paths}."
+            )
+
+        all_uploaded_data = []
+        error_paths: list[str] = []
+        if readable_paths:
+            uploaded_data, error_paths = self._upload_data_with_error_manager(
+                images_to_upload=readable_paths,
+                images_tags=images_tags,
+                max_workers=max_workers,
+            )
+            all_uploaded_data.extend(uploaded_data)
         retry_count = 0
         while error_paths and retry_count < max_retries:
+            # Back off exponentially so transient throttling can clear between attempts
+            time.sleep(0.1 * 2**retry_count)
             uploaded_data, error_paths = self._upload_data_with_error_manager(
-                images_to_upload=error_paths, images_tags=images_tags
+                # A path can be reported by several errors, only retry it once
+                images_to_upload=list(dict.fromkeys(error_paths)),
+                images_tags=images_tags,
+                max_workers=max_workers,
             )
             all_uploaded_data.extend(uploaded_data)
             retry_count += 1
         if error_paths:
             raise Exception(
-                f"Failed to upload the following images: {error_paths} after {max_retries} retries."
+                f"Failed to upload the following images: {error_paths} "
+                f"after {max_retries} retries."
             )
         return all_uploaded_data
 
@@ -119,6 +210,7 @@ class DatasetVersionCreationProcessing:
         images_to_upload: list[str],
         images_tags: list[str] | None = None,
         max_retries: int = 5,
+        max_workers: int | None = None,
     ) -> None:
         """
         Adds images to the dataset version.
@@ -127,12 +219,15 @@ class DatasetVersionCreationProcessing:
             images_to_upload (list[str]): The list of image file paths to upload.
             images_tags (Optional[list[str]]): The list of tags to associate with the images.
             max_retries (int): The maximum number of retries to upload the images.
+            max_workers (Optional[int]): The number of threads uploading files concurrently.
+                Defaults to the Picsellia SDK default.
 
         """
         data = self._upload_images_to_datalake(
             images_to_upload=images_to_upload,
             images_tags=images_tags,
             max_retries=max_retries,
+            max_workers=max_workers,
         )
         self.output_dataset_version.add_data(data=data)
 
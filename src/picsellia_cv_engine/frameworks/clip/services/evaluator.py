@@ -1,6 +1,8 @@
+import json
 import os
 import random
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import cv2
@@ -10,7 +12,9 @@ import sklearn
 import umap
 from picsellia import Experiment
 from picsellia.types.enums import LogType
-from sklearn.metrics import silhouette_score
+from sklearn.decomposition import PCA
+from sklearn.metrics import pairwise_distances, silhouette_score
+from sklearn.neighbors import NearestNeighbors
 
 
 def run_umap_dbscan_clustering(
@@ -92,7 +96,7 @@ def generate_embeddings_from_results(
         batch_results: List of inference result batches.
 
     Returns:
-        A tuple of (embeddings array, image path list).
+        A tuple of (float32 embeddings array of shape (N, D), image path list).
     """
     all_embeddings = []
     all_paths = []
@@ -100,34 +104,83 @@ def generate_embeddings_from_results(
         for img_path, result in zip(images, results, strict=False):
             all_embeddings.append(result["image_embedding"])
             all_paths.append(img_path)
-    return np.array(all_embeddings), all_paths
+    if not all_embeddings:
+        return np.empty((0, 0), dtype=np.float32), []
+
+    # Embedding rows are already float32 arrays, stacking them is a single copy
+    return np.stack(all_embeddings).astype(np.float32, copy=False), all_paths
+
+
+def save_stored_embeddings(
+    embeddings: np.ndarray, image_paths: list[str], file_path: str
+) -> None:
+    """
+    Save embeddings to a .npy file and their image paths to a .json file next to it.
+
+    Args:
+        embeddings: Array of shape (N, D).
+        image_paths: Image paths, one per embedding row.
+        file_path: Path of the store. A .npy or .npz suffix is optional and ignored.
+    """
+    base_path = _embeddings_base_path(file_path)
+    np.save(base_path + ".npy", np.asarray(embeddings), allow_pickle=False)
+    with open(base_path + ".json", "w", encoding="utf-8") as f:
+        json.dump(list(image_paths), f)
 
 
 def load_stored_embeddings(file_path: str) -> tuple[np.ndarray, list[str]]:
     """
-    Load stored embeddings and image paths from a .npz file.
+    Load stored embeddings and image paths.
+
+    Stores written by `save_stored_embeddings` are memory-mapped read-only, so the embeddings
+    are only paged in when accessed. Legacy .npz stores are still read, including their
+    image paths saved as a pickled object array.
 
     Args:
-        file_path: Path to the .npz file.
+        file_path: Path of the store, as given to `save_stored_embeddings`, or a legacy .npz file.
 
     Returns:
         Tuple of (embeddings array, image paths).
     """
-    data = np.load(file_path, allow_pickle=True)
-    return data["embeddings"], data["image_paths"]
+    if file_path.endswith(".npz") and os.path.isfile(file_path):
+        with np.load(file_path, allow_pickle=True) as data:
+            return data["embeddings"], data["image_paths"].tolist()
+
+    base_path = _embeddings_base_path(file_path)
+    embeddings = np.load(base_path + ".npy", mmap_mode="r", allow_pickle=False)
+    with open(base_path + ".json", encoding="utf-8") as f:
+        image_paths = json.load(f)
+    return embeddings, image_paths
+
 
+def _embeddings_base_path(file_path: str) -> str:
+    root, ext = os.path.splitext(file_path)
+    return root if ext in (".npy", ".npz") else file_path
 
-def reduce_dimensionality_umap(embeddings: np.ndarray, n_components: int) -> np.ndarray:
+
+def reduce_dimensionality_umap(
+    embeddings: np.ndarray, n_components: int, pca_components: int | None = 50
+) -> np.ndarray:
     """
     Reduce embedding dimensionality using UMAP.
 
+    Embeddings wider than `pca_components` are first projected with PCA, so UMAP's
+    neighbor search runs on far fewer dimensions.
+
     Args:
         embeddings: High-dimensional embeddings.
         n_components: Target number of dimensions.
+        pca_components: Number of PCA dimensions fed to UMAP, or None to skip the PCA step.
 
     Returns:
         UMAP-reduced embeddings.
     """
+    if pca_components is not None and embeddings.shape[1] > pca_components:
+        n_pca_components = min(pca_components, embeddings.shape[0])
+        embeddings = PCA(n_components=n_pca_components, random_state=42).fit_transform(
+            embeddings
+        )
+
     reducer = umap.UMAP(n_components=n_components, random_state=42)
     reduced_embeddings = reducer.fit_transform(X=embeddings)
     return reduced_embeddings
@@ -147,11 +200,38 @@ def apply_dbscan_clustering(
     Returns:
         Array of cluster labels.
     """
-    dbscan = sklearn.cluster.DBSCAN(eps=dbscan_eps, min_samples=dbscan_min_samples)
+    dbscan = sklearn.cluster.DBSCAN(
+        eps=dbscan_eps, min_samples=dbscan_min_samples, n_jobs=-1
+    )
     labels = dbscan.fit_predict(embeddings)
     return labels
 
 
+def load_rgb_images(
+    image_paths: list[str], max_workers: int = 8
+) -> list[np.ndarray | None]:
+    """
+    Read and decode images concurrently, converting them to RGB.
+
+    Args:
+        image_paths: Image file paths.
+        max_workers: Number of threads reading and decoding images.
+
+    Returns:
+        One RGB array per path, in the same order, or None for images that could not be read.
+    """
+
+    def load_rgb_image(image_path: str) -> np.ndarray | None:
+        img = cv2.imread(image_path)
+        if img is None:
+            return None
+        return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+    # OpenCV releases the GIL while reading and decoding, so threads decode in parallel
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_rgb_image, image_paths))
+
+
 def save_clustering_plots(
     reduced_embeddings: np.ndarray, cluster_labels: np.ndarray, results_dir: str
 ):
@@ -164,11 +244,16 @@ def save_clustering_plots(
         results_dir: Directory to save the plot.
     """
     os.makedirs(results_dir, exist_ok=True)
-    unique_clusters = np.unique(cluster_labels)
     plt.figure(figsize=(10, 6))
 
-    for cluster in unique_clusters:
-        indices = np.where(cluster_labels == cluster)[0]
+    # Group point indices by cluster with a single sort, instead of one scan per cluster
+    order = np.argsort(cluster_labels, kind="stable")
+    boundaries = np.flatnonzero(np.diff(cluster_labels[order])) + 1
+
+    for indices in np.split(order, boundaries):
+        if not indices.size:
+            continue
+        cluster = cluster_labels[indices[0]]
         if cluster == -1:
             plt.scatter(
                 reduced_embeddings[indices, 0],
@@ -241,10 +326,10 @@ def save_cluster_images_plot(
         fig, axes = plt.subplots(grid_size[0], grid_size[1], figsize=(10, 10))
         fig.suptitle(f"Cluster {cluster}", fontsize=14)
 
-        for ax, idx in zip(axes.flatten(), selected_indices, strict=False):
-            img = cv2.imread(image_paths[idx])
-            img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            ax.imshow(img)
+        images = load_rgb_images([image_paths[idx] for idx in selected_indices])
+        for ax, img in zip(axes.flatten(), images, strict=False):
+            if img is not None:
+                ax.imshow(img)
             ax.axis("off")
 
         for i in range(len(selected_indices), grid_size[0] * grid_size[1]):
@@ -284,13 +369,11 @@ def save_outliers_images(
     fig.suptitle("DBSCAN Outliers", fontsize=14)
 
     valid_images = 0
-    for ax, idx in zip(axes.flatten(), selected_indices, strict=False):
-        image_path = str(image_paths[idx])
-        img = cv2.imread(image_path)
+    images = load_rgb_images([str(image_paths[idx]) for idx in selected_indices])
+    for ax, img in zip(axes.flatten(), images, strict=False):
         if img is None:
             ax.axis("off")
             continue
-        img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
         ax.imshow(img)
         ax.axis("off")
         valid_images += 1
@@ -303,25 +386,67 @@ def save_outliers_images(
     plt.close()
 
 
-def find_best_eps(reduced: np.ndarray, eps_list: list[float]) -> float | None:
+def find_best_eps(
+    reduced: np.ndarray,
+    eps_list: list[float],
+    silhouette_sample_size: int | None = 5_000,
+    random_state: int = 42,
+) -> float | None:
     """
     Find the best epsilon value for DBSCAN using silhouette score.
 
     Args:
         reduced: 2D array of reduced embeddings.
         eps_list: List of candidate epsilon values.
+        silhouette_sample_size: Above this many points, silhouette scores are computed on a
+            fixed random sample of this size instead of all points, as their cost is quadratic.
+            None always uses all points.
+        random_state: Seed of the silhouette sample, so the chosen eps is deterministic.
 
     Returns:
         The epsilon value with the highest silhouette score.
     """
+    if not eps_list:
+        return None
+
+    # Compute the neighborhoods once for the largest eps, with the radius queries spread
+    # over all cores. Each DBSCAN run only keeps the neighbors within its own eps
+    distance_graph = (
+        NearestNeighbors(radius=max(eps_list), n_jobs=-1)
+        .fit(reduced)
+        .radius_neighbors_graph(reduced, mode="distance", sort_results=True)
+    )
+
+    # Smaller sets are scored exactly. Larger ones are scored on one seeded sample, whose
+    # pairwise distances are computed once and shared by every eps
+    sample_indices = None
+    sample_distances = None
+    if silhouette_sample_size is not None and len(reduced) > silhouette_sample_size:
+        rng = np.random.default_rng(random_state)
+        sample_indices = rng.choice(
+            len(reduced), size=silhouette_sample_size, replace=False
+        )
+        sample_distances = pairwise_distances(reduced[sample_indices], n_jobs=-1)
+
     best_eps = None
     best_score = -1
     for eps in eps_list:
-        db = sklearn.cluster.DBSCAN(eps=eps, min_samples=5).fit(reduced)
+        db = sklearn.cluster.DBSCAN(eps=eps, min_samples=5, metric="precomputed").fit(
+            distance_graph
+        )
         labels = db.labels_
-        n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
+        n_clusters = len(np.unique(labels)) - (1 if -1 in labels else 0)
         if n_clusters >= 2:
-            score = silhouette_score(reduced, labels)
+            if sample_indices is None:
+                score = silhouette_score(reduced, labels)
+            else:
+                sample_labels = labels[sample_indices]
+                # The silhouette is undefined unless the sample holds 2 to n - 1 labels
+                if not 2 <= len(np.unique(sample_labels)) < len(sample_labels):
+                    continue
+                score = silhouette_score(
+                    sample_distances, sample_labels, metric="precomputed"
+                )
             if score > best_score:
                 best_score = score
                 best_eps = eps
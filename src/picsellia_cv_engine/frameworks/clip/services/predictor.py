@@ -1,9 +1,11 @@
-import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
+import numpy as np
 import torch
 from picsellia import Asset
 from PIL import Image
+from transformers import BatchFeature
 
 from picsellia_cv_engine.core.data import TBaseDataset
 from picsellia_cv_engine.core.services.model.predictor.model_predictor import (
@@ -20,8 +22,8 @@ class PicselliaCLIPEmbeddingPrediction:
     """
 
     asset: Asset
-    image_embedding: list[float]
-    text_embedding: list[float]
+    image_embedding: np.ndarray
+    text_embedding: np.ndarray
 
 
 class CLIPModelPredictor(ModelPredictor):
@@ -40,8 +42,12 @@ class CLIPModelPredictor(ModelPredictor):
         super().__init__(model=model)
         self.model = model
         self.device = device
+        # Tensor cores only pay off on CUDA, CPU inference stays in FP32
+        self.use_autocast = device.startswith("cuda")
+        # Page-locked host buffers let image batches be copied to the GPU asynchronously
+        self.pin_memory = device.startswith("cuda")
 
-    def embed_image(self, image_path: str) -> list[float]:
+    def embed_image(self, image_path: str) -> np.ndarray:
         """
         Encode an image into a CLIP embedding.
 
@@ -49,19 +55,64 @@ class CLIPModelPredictor(ModelPredictor):
             image_path: Path to the input image.
 
         Returns:
-            A list of float values representing the image embedding.
+            A float32 array of shape (D,) representing the image embedding.
         """
-        image = Image.open(image_path).convert("RGB")
-        inputs = self.model.loaded_processor(images=image, return_tensors="pt").to(
-            self.device
-        )
+        return self.embed_images([image_path])[0]
+
+    def embed_images(self, image_paths: list[str]) -> np.ndarray:
+        """
+        Encode several images into CLIP embeddings with a single forward pass.
+
+        Args:
+            image_paths: Paths to the input images.
+
+        Returns:
+            A float32 array of shape (N, D), one row per image in the order of the input paths.
+        """
+        return self._embed_image_inputs(self._preprocess_images(image_paths))
+
+    def _preprocess_images(self, image_paths: list[str]) -> BatchFeature:
+        """
+        Decode images and turn them into CLIP processor inputs, on the CPU.
+
+        On CUDA, the pixel values are placed in pinned memory so that the device copy does
+        not block.
+
+        Args:
+            image_paths: Paths to the input images.
+
+        Returns:
+            The processor inputs for the whole batch.
+        """
+        images = [Image.open(image_path).convert("RGB") for image_path in image_paths]
+        inputs = self.model.loaded_processor(images=images, return_tensors="pt")
+        if self.pin_memory:
+            inputs["pixel_values"] = inputs["pixel_values"].pin_memory()
+        return inputs
+
+    def _embed_image_inputs(self, inputs: BatchFeature) -> np.ndarray:
+        """
+        Run the vision tower on preprocessed image inputs.
+
+        Args:
+            inputs: Processor inputs, as returned by `_preprocess_images`.
 
-        with torch.no_grad():
-            image_emb = self.model.loaded_model.get_image_features(**inputs)
+        Returns:
+            A float32 array of shape (N, D), one row per image of the batch.
+        """
+        device_inputs = inputs.to(self.device, non_blocking=self.pin_memory)
 
-        return image_emb[0].cpu().tolist()
+        with (
+            torch.inference_mode(),
+            torch.autocast(
+                device_type="cuda", dtype=torch.float16, enabled=self.use_autocast
+            ),
+        ):
+            image_embs = self.model.loaded_model.get_image_features(**device_inputs)
 
-    def embed_text(self, text: str) -> list[float]:
+        return image_embs.float().cpu().numpy()
+
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Encode a text string into a CLIP embedding.
 
@@ -69,16 +120,33 @@ class CLIPModelPredictor(ModelPredictor):
             text: Input text string.
 
         Returns:
-            A list of float values representing the text embedding.
+            A float32 array of shape (D,) representing the text embedding.
+        """
+        return self.embed_texts([text])[0]
+
+    def embed_texts(self, texts: list[str]) -> np.ndarray:
+        """
+        Encode several text strings into CLIP embeddings with a single forward pass.
+
+        Args:
+            texts: Input text strings.
+
+        Returns:
+            A float32 array of shape (N, D), one row per text in the order of the input texts.
         """
         inputs = self.model.loaded_processor(
-            text=[text], return_tensors="pt", padding=True
+            text=texts, return_tensors="pt", padding=True
         ).to(self.device)
 
-        with torch.no_grad():
-            text_emb = self.model.loaded_model.get_text_features(**inputs)
+        with (
+            torch.inference_mode(),
+            torch.autocast(
+                device_type="cuda", dtype=torch.float16, enabled=self.use_autocast
+            ),
+        ):
+            text_embs = self.model.loaded_model.get_text_features(**inputs)
 
-        return text_emb[0].cpu().tolist()
+        return text_embs.float().cpu().numpy()
 
     def run_image_inference_on_batches(
         self, image_batches: list[list[str]]
@@ -86,19 +154,32 @@ class CLIPModelPredictor(ModelPredictor):
         """
         Perform inference on batches of images.
 
+        Each batch is embedded with a single forward pass. The next batch is decoded
+        and preprocessed in a background thread while the current one runs through the
+        model, so the device does not wait on image decoding.
+
         Args:
             image_batches: List of batches, each batch is a list of image paths.
 
         Returns:
             Nested list of dictionaries containing image embeddings.
         """
-        results = []
-        for batch in image_batches:
-            batch_results = []
-            for image_path in batch:
-                embedding = self.embed_image(image_path)
-                batch_results.append({"image_embedding": embedding})
-            results.append(batch_results)
+        results: list[list[dict]] = []
+        if not image_batches:
+            return results
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            next_inputs = executor.submit(self._preprocess_images, image_batches[0])
+            for next_batch in [*image_batches[1:], None]:
+                inputs = next_inputs.result()
+                if next_batch is not None:
+                    next_inputs = executor.submit(self._preprocess_images, next_batch)
+                results.append(
+                    [
+                        {"image_embedding": embedding}
+                        for embedding in self._embed_image_inputs(inputs)
+                    ]
+                )
         return results
 
     def run_inference_on_batches(
@@ -107,6 +188,8 @@ class CLIPModelPredictor(ModelPredictor):
         """
         Perform inference on batches of image-text pairs.
 
+        The images and the texts of each batch are each embedded with a single forward pass.
+
         Args:
             image_text_batches: List of batches containing (image_path, text) tuples.
 
@@ -115,14 +198,21 @@ class CLIPModelPredictor(ModelPredictor):
         """
         results = []
         for batch in image_text_batches:
-            batch_results = []
-            for image_path, text in batch:
-                result = {
-                    "image_embedding": self.embed_image(image_path),
-                    "text_embedding": self.embed_text(text),
-                }
-                batch_results.append(result)
-            results.append(batch_results)
+            image_embeddings = self.embed_images(
+                [image_path for image_path, _ in batch]
+            )
+            text_embeddings = self.embed_texts([text for _, text in batch])
+            results.append(
+                [
+                    {
+                        "image_embedding": image_embedding,
+                        "text_embedding": text_embedding,
+                    }
+                    for image_embedding, text_embedding in zip(
+                        image_embeddings, text_embeddings, strict=True
+                    )
+                ]
+            )
         return results
 
     def post_process_batches(
@@ -137,22 +227,23 @@ class CLIPModelPredictor(ModelPredictor):
         Args:
             image_text_batches: Input image-text batches.
             batch_results: Corresponding results from inference.
-            dataset: Dataset object to resolve asset references.
+            dataset: Dataset object to resolve asset references, fetched with a single request.
 
         Returns:
             List of PicselliaCLIPEmbeddingPrediction.
         """
         all_predictions = []
+        assets_by_path = self.get_assets_by_image_path(
+            [image_path for batch in image_text_batches for image_path, _ in batch],
+            dataset,
+        )
 
         for image_texts, results in zip(
             image_text_batches, batch_results, strict=False
         ):
             for (image_path, _), result in zip(image_texts, results, strict=False):
-                asset_id = os.path.splitext(os.path.basename(image_path))[0]
-                asset = dataset.dataset_version.list_assets(ids=[asset_id])[0]
-
                 prediction = PicselliaCLIPEmbeddingPrediction(
-                    asset=asset,
+                    asset=assets_by_path[image_path],
                     image_embedding=result["image_embedding"],
                     text_embedding=result["text_embedding"],
                 )
@@ -172,21 +263,21 @@ class CLIPModelPredictor(ModelPredictor):
         Args:
             image_batches: List of image batches.
             batch_results: Corresponding image-only inference results.
-            dataset: Dataset object to resolve asset references.
+            dataset: Dataset object to resolve asset references, fetched with a single request.
 
         Returns:
             List of PicselliaCLIPEmbeddingPrediction with empty text embeddings.
         """
         all_predictions = []
+        assets_by_path = self.get_assets_by_image_path(
+            [image_path for batch in image_batches for image_path in batch], dataset
+        )
         for batch, results in zip(image_batches, batch_results, strict=False):
             for image_path, result in zip(batch, results, strict=False):
-                asset_id = os.path.splitext(os.path.basename(image_path))[0]
-                asset = dataset.dataset_version.list_assets(ids=[asset_id])[0]
-
                 prediction = PicselliaCLIPEmbeddingPrediction(
-                    asset=asset,
+                    asset=assets_by_path[image_path],
                     image_embedding=result["image_embedding"],
-                    text_embedding=[],
+                    text_embedding=np.empty(0, dtype=np.float32),
                 )
                 all_predictions.append(prediction)
         return all_predictions
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from PIL import Image
@@ -14,24 +15,32 @@ class SAM2ModelPredictor:
     def __init__(self, predictor: SAM2ImagePredictor):
         self.predictor = predictor
 
-    def pre_process_dataset(self, dataset: CocoDataset) -> list[np.ndarray]:
+    def pre_process_dataset(
+        self, dataset: CocoDataset, max_workers: int | None = None
+    ) -> list[np.ndarray]:
         """
-        Collects image file paths from the dataset.
+        Loads the dataset images as RGB arrays.
 
         Args:
             dataset (CocoDataset): Dataset object containing image directory.
+            max_workers (int | None): Number of threads decoding images concurrently.
+                Defaults to the `ThreadPoolExecutor` default.
 
         Returns:
-            list[str]: List of full paths to image files.
+            list[np.ndarray]: The decoded images.
         """
-        images = []
-        for f in os.listdir(dataset.images_dir):
-            if f.lower().endswith(self.VALID_IMAGE_EXTENSIONS):
-                image_path = os.path.join(dataset.images_dir, f)
-                img = Image.open(image_path).convert("RGB")
-                img_np = np.array(img)
-                images.append(img_np)
-        return images
+        image_paths = [
+            os.path.join(dataset.images_dir, f)
+            for f in os.listdir(dataset.images_dir)
+            if f.lower().endswith(self.VALID_IMAGE_EXTENSIONS)
+        ]
+
+        def load_image(image_path: str) -> np.ndarray:
+            return np.array(Image.open(image_path).convert("RGB"))
+
+        # PIL releases the GIL while decoding, so images are decoded in parallel
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(load_image, image_paths))
 
     def preprocess_images(self, image_list: list[np.ndarray]):
         self.predictor.set_image_batch(image_list=image_list)
@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 from picsellia import Asset
 from ultralytics.engine.results import Results
 
@@ -149,27 +150,55 @@ class UltralyticsDetectionModelPredictor(ModelPredictor[UltralyticsModel]):
         if not prediction.boxes:
             return [], [], []
 
-        # Extract normalized boxes and rescale them
-        normalized_boxes = prediction.boxes.xyxyn.cpu().numpy()
-        boxes_list = [
-            self.rescale_normalized_box(box, asset.width, asset.height)
-            for box in normalized_boxes
-        ]
-        casted_boxes = [self.cast_type_list_to_int(box) for box in boxes_list]
+        # Extract normalized boxes and rescale them all at once to [x, y, width, height]
+        boxes_list = self.rescale_normalized_boxes(
+            prediction.boxes.xyxyn.cpu().numpy(), asset.width, asset.height
+        )
+
+        # Copy classes to the host once instead of once per box
+        class_ids = prediction.boxes.cls.int().tolist()
+
+        # Resolve each predicted class once, not once per box
+        labels_by_class_id = {
+            class_id: self.get_picsellia_label(prediction.names[class_id], dataset)
+            for class_id in dict.fromkeys(class_ids)
+        }
 
         # Convert to Picsellia types
-        picsellia_boxes = [PicselliaRectangle(*box) for box in casted_boxes]
-        picsellia_labels = [
-            self.get_picsellia_label(prediction.names[int(cls.cpu().numpy())], dataset)
-            for cls in prediction.boxes.cls
-        ]
-        picsellia_confidences = [
-            PicselliaConfidence(float(conf.cpu().numpy()))
-            for conf in prediction.boxes.conf
-        ]
+        picsellia_boxes = self.get_picsellia_rectangles(boxes_list)
+        picsellia_labels = [labels_by_class_id[class_id] for class_id in class_ids]
+        picsellia_confidences = self.get_picsellia_confidences(
+            prediction.boxes.conf.cpu().numpy()
+        )
 
         return picsellia_boxes, picsellia_labels, picsellia_confidences
 
+    @staticmethod
+    def rescale_normalized_boxes(boxes: np.ndarray, width, height) -> np.ndarray:
+        """
+        Rescales bounding boxes from normalized coordinates to pixel dimensions, all at once.
+
+        Args:
+            boxes (np.ndarray): Normalized boxes of shape (N, 4) in [x_min, y_min, x_max, y_max] format.
+            width (int): Image width.
+            height (int): Image height.
+
+        Returns:
+            np.ndarray: Rescaled int64 boxes of shape (N, 4) in [x, y, width, height] format.
+        """
+        x_min, y_min, x_max, y_max = (
+            np.asarray(boxes, dtype=np.float64).reshape(-1, 4).T
+        )
+        return np.stack(
+            [
+                x_min * width,
+                y_min * height,
+                (x_max - x_min) * width,
+                (y_max - y_min) * height,
+            ],
+            axis=1,
+        ).astype(np.int64)
+
     @staticmethod
     def rescale_normalized_box(box, width, height) -> list[int]:
         """
@@ -183,13 +212,9 @@ class UltralyticsDetectionModelPredictor(ModelPredictor[UltralyticsModel]):
         Returns:
             list[int]: Rescaled box in [x, y, width, height] format.
         """
-        x_min, y_min, x_max, y_max = box
-        return [
-            int(x_min * width),
-            int(y_min * height),
-            int((x_max - x_min) * width),
-            int((y_max - y_min) * height),
-        ]
+        return UltralyticsDetectionModelPredictor.rescale_normalized_boxes(
+            [box], width, height
+        )[0].tolist()
 
     @staticmethod
     def cast_type_list_to_int(box) -> list[int]:
@@ -142,17 +142,20 @@ class UltralyticsSegmentationModelPredictor(ModelPredictor[UltralyticsModel]):
 
         # Convert to Picsellia types
         picsellia_polygons = [PicselliaPolygon(points) for points in polygons_list]
-        picsellia_labels = [
-            self.get_picsellia_label(
-                prediction.names[int(cls.cpu().numpy())],
+        # Copy classes and confidences to the host once instead of once per mask,
+        # and resolve each predicted class once
+        class_ids = prediction.boxes.cls.int().tolist()
+        labels_by_class_id = {
+            class_id: self.get_picsellia_label(
+                prediction.names[class_id],
                 dataset=dataset,
             )
-            for cls in prediction.boxes.cls
-        ]
-        picsellia_confidences = [
-            PicselliaConfidence(float(conf.cpu().numpy()))
-            for conf in prediction.boxes.conf
-        ]
+            for class_id in dict.fromkeys(class_ids)
+        }
+        picsellia_labels = [labels_by_class_id[class_id] for class_id in class_ids]
+        picsellia_confidences = self.get_picsellia_confidences(
+            prediction.boxes.conf.cpu().numpy()
+        )
 
         return picsellia_polygons, picsellia_labels, picsellia_confidences
 
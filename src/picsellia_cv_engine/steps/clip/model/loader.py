@@ -18,6 +18,7 @@ def load_model(
     config_name: str | None = None,
     exported_weights_name: str | None = None,
     repo_id: str = "openai/clip-vit-large-patch14-336",
+    compile_model: bool = False,
 ) -> CLIPModel:
     """
     Load a CLIP model using the Picsellia model interface.
@@ -28,6 +29,7 @@ def load_model(
         config_name: Optional name of the model config file.
         exported_weights_name: Optional name of exported weights for evaluation or inference.
         repo_id: HuggingFace repo ID used for loading the processor (default is OpenAI's ViT-L/14-336).
+        compile_model: Whether to compile the vision and text towers with torch.compile for faster inference.
 
     Returns:
         A loaded instance of CLIPModel, ready for inference.
@@ -52,7 +54,9 @@ def load_model(
         raise FileNotFoundError("No pretrained weights path found in model.")
 
     loaded_model, loaded_processor = model.load_weights(
-        weights_path=model.pretrained_weights_path, repo_id=repo_id
+        weights_path=model.pretrained_weights_path,
+        repo_id=repo_id,
+        compile_model=compile_model,
     )
     model.set_loaded_model(loaded_model)
     model.set_loaded_processor(loaded_processor)
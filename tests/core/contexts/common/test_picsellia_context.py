@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from picsellia_cv_engine.core.contexts.common.picsellia_context import (
+    PicselliaContext,
+)
+
+
+class ConcretePicselliaContext(PicselliaContext):
+    @property
+    def working_dir(self) -> str:
+        return "working_dir"
+
+    def to_dict(self):
+        return {}
+
+
+@pytest.fixture
+def mock_client_cls(monkeypatch):
+    monkeypatch.delenv("REQUESTS_CA_BUNDLE", raising=False)
+    with patch(
+        "picsellia_cv_engine.core.contexts.common.picsellia_context.picsellia.Client"
+    ) as client_cls:
+        client_cls.return_value.connexion.organization_id = "client-organization"
+        yield client_cls
+
+
+class TestPicselliaContext:
+    def test_init_does_not_create_the_client(self, mock_client_cls, monkeypatch):
+        monkeypatch.delenv("organization_id", raising=False)
+
+        ConcretePicselliaContext(api_token="token")
+
+        mock_client_cls.assert_not_called()
+
+    def test_organization_id_is_resolved_from_the_client(
+        self, mock_client_cls, monkeypatch
+    ):
+        monkeypatch.delenv("organization_id", raising=False)
+        context = ConcretePicselliaContext(api_token="token")
+
+        assert context.organization_id == "client-organization"
+        assert context.organization_id == "client-organization"
+        mock_client_cls.assert_called_once()
+
+    def test_configured_organization_id_does_not_need_the_client(
+        self, mock_client_cls
+    ):
+        context = ConcretePicselliaContext(
+            api_token="token", organization_id="organization"
+        )
+
+        assert context.organization_id == "organization"
+        mock_client_cls.assert_not_called()
+
+    def test_given_client_is_reused(self, mock_client_cls, monkeypatch):
+        monkeypatch.delenv("organization_id", raising=False)
+        client = MagicMock()
+        client.connexion.organization_id = "shared-organization"
+
+        context = ConcretePicselliaContext(api_token="token", client=client)
+
+        assert context.client is client
+        assert context.organization_id == "shared-organization"
+        mock_client_cls.assert_not_called()
@@ -0,0 +1,54 @@
+import os
+import threading
+import time
+from unittest.mock import MagicMock
+
+from picsellia_cv_engine.core.models import Model
+
+
+def make_file(name: str, active_directories: dict[str, int], lock: threading.Lock):
+    file = MagicMock()
+    file.name = name
+    file.filename = f"{name}.bin"
+
+    def download(directory: str) -> None:
+        with lock:
+            assert active_directories.get(directory, 0) == 0
+            active_directories[directory] = 1
+        time.sleep(0.01)
+        with open(os.path.join(directory, file.filename), "w") as f:
+            f.write(name)
+        with lock:
+            active_directories[directory] = 0
+
+    file.download.side_effect = download
+    return file
+
+
+class TestModelDownloadFiles:
+    def test_download_model_weights_sets_paths_and_serializes_directories(
+        self, tmp_path
+    ):
+        active_directories: dict[str, int] = {}
+        lock = threading.Lock()
+        files = [
+            make_file(name, active_directories, lock)
+            for name in ["pretrained", "extra_1", "config", "extra_2", "extra_3"]
+        ]
+        model = Model(
+            name="model",
+            model_version=MagicMock(),
+            pretrained_weights_name="pretrained",
+            config_name="config",
+        )
+
+        model.download_model_weights(str(tmp_path), model_files=files, max_workers=4)
+
+        assert model.pretrained_weights_path == os.path.join(
+            model.pretrained_weights_dir, "pretrained.bin"
+        )
+        assert model.config_path == os.path.join(model.config_dir, "config.bin")
+        assert model.trained_weights_path is None
+        assert model.exported_weights_path is None
+        for name in ["extra_1", "extra_2", "extra_3"]:
+            assert os.path.isfile(os.path.join(model.weights_dir, f"{name}.bin"))
@@ -0,0 +1,65 @@
+from typing import Optional
+
+import pytest
+
+from picsellia_cv_engine.core.parameters import Parameters
+
+
+class ConcreteParameters(Parameters):
+    pass
+
+
+@pytest.fixture
+def parameters() -> ConcreteParameters:
+    return ConcreteParameters(
+        log_data={"ids": [1, 2, 3], "name": "value", "count": "3", "empty": "null"}
+    )
+
+
+class TestExtractOptionalParameter:
+    @pytest.mark.parametrize(
+        "expected_type",
+        [Optional[list[int]], list[int] | None],  # noqa: UP045
+    )
+    def test_optional_generic_keeps_its_value(self, parameters, expected_type):
+        assert parameters.extract_parameter(
+            keys=["ids"], expected_type=expected_type
+        ) == [1, 2, 3]
+
+    @pytest.mark.parametrize(
+        "expected_type",
+        [Optional[str], str | None],  # noqa: UP045
+    )
+    def test_optional_str_keeps_its_value(self, parameters, expected_type):
+        assert (
+            parameters.extract_parameter(keys=["name"], expected_type=expected_type)
+            == "value"
+        )
+
+    @pytest.mark.parametrize(
+        "expected_type",
+        [Optional[str], str | None, Optional[list[int]], list[int] | None],  # noqa: UP045
+    )
+    def test_optional_null_string_is_none(self, parameters, expected_type):
+        assert (
+            parameters.extract_parameter(keys=["empty"], expected_type=expected_type)
+            is None
+        )
+
+    @pytest.mark.parametrize(
+        "expected_type",
+        [Optional[int], int | None],  # noqa: UP045
+    )
+    def test_optional_int_is_coerced(self, parameters, expected_type):
+        assert (
+            parameters.extract_parameter(keys=["count"], expected_type=expected_type)
+            == 3
+        )
+
+    def test_pep_604_optional_accepts_a_none_default(self, parameters):
+        assert (
+            parameters.extract_parameter(
+                keys=["missing"], expected_type=int | None, default=None
+            )
+            is None
+        )
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from picsellia.types.enums import ImportAnnotationMode
+
+from picsellia_cv_engine.core.services.data.dataset.uploader.utils import (
+    upload_annotations,
+)
+
+
+def make_dataset(coco_data: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        coco_data=coco_data,
+        coco_file_path="annotations.json",
+        dataset_version=MagicMock(),
+    )
+
+
+class TestUploadAnnotations:
+    def test_skips_import_without_annotations_nor_categories(self):
+        dataset = make_dataset({"images": [], "annotations": [], "categories": []})
+
+        upload_annotations(dataset)
+
+        dataset.dataset_version.import_annotations_coco_file.assert_not_called()
+
+    def test_imports_categories_without_annotations(self):
+        dataset = make_dataset(
+            {
+                "images": [],
+                "annotations": [],
+                "categories": [{"id": 1, "name": "car"}],
+            }
+        )
+
+        upload_annotations(dataset)
+
+        dataset.dataset_version.import_annotations_coco_file.assert_called_once_with(
+            file_path="annotations.json",
+            use_id=True,
+            fail_on_asset_not_found=True,
+            mode=ImportAnnotationMode.KEEP,
+        )
+
+    @pytest.mark.parametrize("categories", [[], [{"id": 1, "name": "car"}]])
+    def test_replace_always_imports(self, categories):
+        dataset = make_dataset(
+            {"images": [], "annotations": [], "categories": categories}
+        )
+
+        upload_annotations(dataset, replace_annotations=True)
+
+        dataset.dataset_version.import_annotations_coco_file.assert_called_once_with(
+            file_path="annotations.json",
+            use_id=True,
+            fail_on_asset_not_found=True,
+            mode=ImportAnnotationMode.REPLACE,
+        )
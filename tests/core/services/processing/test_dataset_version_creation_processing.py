@@ -0,0 +1,66 @@
+from unittest.mock import MagicMock
+
+import pytest
+from picsellia.types.enums import InferenceType
+
+from picsellia_cv_engine.core.services.processing.dataset_version_creation_processing import (
+    DatasetVersionCreationProcessing,
+)
+
+
+@pytest.fixture
+def processing() -> DatasetVersionCreationProcessing:
+    return DatasetVersionCreationProcessing(
+        client=MagicMock(), datalake=MagicMock(), output_dataset_version=MagicMock()
+    )
+
+
+class TestUpdateOutputDatasetVersionMetadata:
+    def test_description_only_does_not_send_type(self, processing):
+        processing.update_output_dataset_version_metadata(description="new description")
+
+        processing.output_dataset_version.update.assert_called_once_with(
+            description="new description"
+        )
+
+    def test_inference_type_only_does_not_send_description(self, processing):
+        processing.update_output_dataset_version_metadata(
+            inference_type=InferenceType.OBJECT_DETECTION
+        )
+
+        processing.output_dataset_version.update.assert_called_once_with(
+            type=InferenceType.OBJECT_DETECTION
+        )
+
+    def test_both_fields_are_sent_in_one_update(self, processing):
+        processing.update_output_dataset_version_metadata(
+            description="new description",
+            inference_type=InferenceType.CLASSIFICATION,
+        )
+
+        processing.output_dataset_version.update.assert_called_once_with(
+            description="new description", type=InferenceType.CLASSIFICATION
+        )
+
+    def test_no_fields_skips_the_update(self, processing):
+        processing.update_output_dataset_version_metadata()
+
+        processing.output_dataset_version.update.assert_not_called()
+
+
+class TestUploadImagesToDatalake:
+    def test_missing_or_empty_images_fail_before_any_upload(
+        self, processing, tmp_path
+    ):
+        readable_path = tmp_path / "readable.jpg"
+        readable_path.write_bytes(b"image")
+        empty_path = tmp_path / "empty.jpg"
+        empty_path.touch()
+        missing_path = tmp_path / "missing.jpg"
+
+        image_paths = [str(readable_path), str(empty_path), str(missing_path)]
+
+        with pytest.raises(Exception, match="missing or empty"):
+            processing._upload_images_to_datalake(images_to_upload=image_paths)
+
+        processing.datalake.upload_data.assert_not_called()
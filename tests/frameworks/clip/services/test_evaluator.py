@@ -0,0 +1,122 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+pytest.importorskip("umap")
+
+from sklearn.cluster import DBSCAN
+from sklearn.metrics import silhouette_score
+
+from picsellia_cv_engine.frameworks.clip.services.evaluator import (
+    apply_dbscan_clustering,
+    find_best_eps,
+    load_stored_embeddings,
+    save_stored_embeddings,
+)
+
+EPS_LIST = [0.05, 0.1, 0.3, 0.5, 0.8]
+
+
+@pytest.fixture
+def blobs() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    centers = np.array([[0.0, 0.0], [3.0, 3.0], [0.0, 4.0]])
+    return np.concatenate(
+        [center + rng.normal(scale=0.2, size=(40, 2)) for center in centers]
+    )
+
+
+def refit_best_eps(
+    reduced: np.ndarray, eps_list: list[float]
+) -> tuple[float | None, np.ndarray | None]:
+    best_eps, best_labels, best_score = None, None, -1
+    for eps in eps_list:
+        labels = DBSCAN(eps=eps, min_samples=5).fit(reduced).labels_
+        n_clusters = len(set(labels)) - (1 if -1 in labels else 0)
+        if n_clusters >= 2:
+            score = silhouette_score(reduced, labels)
+            if score > best_score:
+                best_eps, best_labels, best_score = eps, labels, score
+    return best_eps, best_labels
+
+
+class TestFindBestEps:
+    def test_matches_refitting_dbscan_for_each_eps(self, blobs):
+        expected_eps, expected_labels = refit_best_eps(blobs, EPS_LIST)
+
+        best_eps = find_best_eps(blobs, EPS_LIST)
+
+        assert best_eps == expected_eps
+        labels = apply_dbscan_clustering(
+            blobs, dbscan_eps=best_eps, dbscan_min_samples=5
+        )
+        np.testing.assert_array_equal(labels, expected_labels)
+
+    def test_returns_none_without_candidates(self, blobs):
+        assert find_best_eps(blobs, []) is None
+
+    def test_sampled_silhouette_is_deterministic(self, blobs):
+        sampled_eps = [
+            find_best_eps(blobs, EPS_LIST, silhouette_sample_size=60, random_state=7)
+            for _ in range(2)
+        ]
+
+        assert sampled_eps[0] == sampled_eps[1]
+        assert sampled_eps[0] == find_best_eps(
+            blobs, EPS_LIST, silhouette_sample_size=None
+        )
+
+    def test_sampled_silhouette_uses_precomputed_distances(self, blobs):
+        with patch(
+            "picsellia_cv_engine.frameworks.clip.services.evaluator.silhouette_score",
+            wraps=silhouette_score,
+        ) as silhouette_mock:
+            find_best_eps(blobs, EPS_LIST, silhouette_sample_size=60)
+
+        assert silhouette_mock.call_count > 0
+        for call in silhouette_mock.call_args_list:
+            distances, labels = call.args
+            assert call.kwargs == {"metric": "precomputed"}
+            assert distances.shape == (60, 60)
+            assert labels.shape == (60,)
+
+
+class TestStoredEmbeddings:
+    @pytest.mark.parametrize(
+        "file_name", ["embeddings", "embeddings.npy", "embeddings.npz"]
+    )
+    def test_round_trip_is_memory_mapped(self, tmp_path, file_name):
+        file_path = str(tmp_path / file_name)
+        embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)
+        image_paths = ["a.jpg", "dir/b\nc.jpg", "c d.png"]
+
+        save_stored_embeddings(embeddings, image_paths, file_path)
+        loaded_embeddings, loaded_paths = load_stored_embeddings(file_path)
+
+        assert isinstance(loaded_embeddings, np.memmap)
+        np.testing.assert_array_equal(loaded_embeddings, embeddings)
+        assert loaded_paths == image_paths
+
+    def test_round_trip_without_embeddings(self, tmp_path):
+        file_path = str(tmp_path / "embeddings.npy")
+
+        save_stored_embeddings(np.empty((0, 4), dtype=np.float32), [], file_path)
+        loaded_embeddings, loaded_paths = load_stored_embeddings(file_path)
+
+        assert loaded_embeddings.shape == (0, 4)
+        assert loaded_paths == []
+
+    def test_loads_legacy_npz_store(self, tmp_path):
+        file_path = str(tmp_path / "embeddings.npz")
+        embeddings = np.arange(6, dtype=np.float32).reshape(2, 3)
+        np.savez(
+            file_path,
+            embeddings=embeddings,
+            image_paths=np.array(["a.jpg", "b.jpg"], dtype=object),
+        )
+
+        loaded_embeddings, loaded_paths = load_stored_embeddings(file_path)
+
+        np.testing.assert_array_equal(loaded_embeddings, embeddings)
+        assert loaded_paths == ["a.jpg", "b.jpg"]